@@ -2,11 +2,33 @@
 pansyncer bands.py
 Ham radio band definitions and utilities
 """
+from array import array
 from dataclasses import dataclass
-from bisect import bisect_right
 from pansyncer.utils import beep
 
-@dataclass
+try:                                                    # optional JIT for batch sweeps
+    import numpy
+    import numba
+except ImportError:
+    numpy = None
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _classify_batch_jit(starts, ends, freqs, out):  # pragma: no cover - needs numba
+        n = starts.shape[0]
+        for k in range(freqs.shape[0]):
+            f = freqs[k]
+            i = 0
+            while i < n and starts[i] <= f:
+                i += 1
+            i -= 1
+            if i >= 0 and f <= ends[i]:
+                out[k] = i
+            else:
+                out[k] = -1
+
+@dataclass(slots=True)
 class Band:
     name: str
     start: float
@@ -88,48 +110,99 @@ class Bands:
     def __init__(self, bands=None):
         source = bands if bands is not None else DEFAULT_BANDS
         self._bands = normalize_bands(source)
-        self._starts = [b.start for b in self._bands]
-        self._ends   = [b.end   for b in self._bands]
+        self._starts = array('d', (b.start for b in self._bands))
+        self._ends   = array('d', (b.end   for b in self._bands))
+        self._starts_hz = array('q', (int(round(b.start * 1_000_000)) for b in self._bands))
+        self._ends_hz   = array('q', (int(round(b.end   * 1_000_000)) for b in self._bands))
+        self._n      = len(self._bands)
+        self._last_idx = 0
 
     def band_name(self, freq_mhz):
-        idx = self._get_band_index(freq_mhz)
-        return self._bands[idx].name if idx is not None else "OOB"
+        idx, inside = self._locate(freq_mhz)
+        return self._bands[idx].name if inside else "OOB"
+
+    def band_name_hz(self, freq_hz):
+        """band_name for an integer frequency in Hz. The per-tick display
+        path calls this with radio frequencies, so the MHz conversion and
+        its float division are skipped in favour of pure int compares."""
+        starts = self._starts_hz
+        ends = self._ends_hz
+        i = self._last_idx
+        if starts[i] <= freq_hz <= ends[i]:
+            return self._bands[i].name
+        i = 0
+        n = self._n
+        while i < n and starts[i] <= freq_hz:
+            i += 1
+        i -= 1
+        if i >= 0 and freq_hz <= ends[i]:
+            self._last_idx = i
+            return self._bands[i].name
+        return "OOB"
 
     def step(self, freq_mhz, direction):
         """Band Up / Down"""
-        idx_inside = self._get_band_index(freq_mhz)
-        if idx_inside is not None:
+        idx, inside = self._locate(freq_mhz)
+        if inside:
             if direction > 0:
-                if idx_inside == len(self._bands) - 1:
+                if idx == self._n - 1:
                     beep()
                     return False
-                self._bands[idx_inside].goto = freq_mhz
-                return self._bands[idx_inside + 1].goto
+                self._bands[idx].goto = freq_mhz
+                return self._bands[idx + 1].goto
             else:
-                if idx_inside == 0:
+                if idx == 0:
                     beep()
                     return False
-                self._bands[idx_inside].goto = freq_mhz
-                return self._bands[idx_inside - 1].goto
+                self._bands[idx].goto = freq_mhz
+                return self._bands[idx - 1].goto
 
-        i = self._index_for(freq_mhz)
         if direction > 0:
-            next_idx = i + 1
-            if next_idx >= len(self._bands):
+            next_idx = idx + 1
+            if next_idx >= self._n:
                 beep()
                 return False
             return self._bands[next_idx].goto
         else:
-            if i < 0:
+            if idx < 0:
                 beep()
                 return False
-            return self._bands[i].goto
-
-    def _index_for(self, freq_mhz):
-        return bisect_right(self._starts, freq_mhz) - 1
-
-    def _get_band_index(self, freq_mhz):
-        i = self._index_for(freq_mhz)
-        if 0 <= i < len(self._bands) and freq_mhz <= self._ends[i]:
-            return i
-        return None
+            return self._bands[idx].goto
+
+    def classify_batch(self, freqs_mhz):
+        """Classify a sequence of frequencies at once, e.g. an SDR sweep.
+        Returns a list (or numpy array) of band indices, -1 for out of band.
+        Compiled with numba when available, plain Python otherwise."""
+        if numba is not None:
+            freqs = numpy.asarray(freqs_mhz, dtype=numpy.float64)
+            out = numpy.empty(len(freqs), dtype=numpy.int64)
+            _classify_batch_jit(numpy.asarray(self._starts),
+                                numpy.asarray(self._ends),
+                                freqs, out)
+            return out
+        result = []
+        for f in freqs_mhz:
+            idx, inside = self._locate(f)
+            result.append(idx if inside else -1)
+        return result
+
+    def _locate(self, freq_mhz):
+        """Return (index, inside). Index is the last band starting at or below
+        freq_mhz (-1 if below all bands); inside tells whether freq_mhz falls
+        within that band. A plain linear probe beats bisect for ~10 bands.
+        Consecutive knob ticks almost always stay in the same band, so the
+        last inside hit is checked first."""
+        starts = self._starts
+        ends = self._ends
+        i = self._last_idx
+        if starts[i] <= freq_mhz <= ends[i]:
+            return i, True
+        i = 0
+        n = self._n
+        while i < n and starts[i] <= freq_mhz:
+            i += 1
+        i -= 1
+        inside = i >= 0 and freq_mhz <= ends[i]
+        if inside:
+            self._last_idx = i
+        return i, inside
@@ -3,19 +3,15 @@ pansyncer config.py
 Central configuration loader that uses per-module config classes
 """
 
+import os
 import sys
+import pickle
 import tomllib
 from dataclasses import dataclass
 from typing import Optional
 
-from pansyncer.sync import SyncConfig
-from pansyncer.device_register import DeviceRegisterConfig
-from pansyncer.display import DisplayConfig
-from pansyncer.knob import KnobConfig
-from pansyncer.rigcheck import RigCheckConfig
-from pansyncer.reconnect_scheduler import SchedulerConfig
-from pansyncer.evdev_hotplug import InputHotplugConfig
-from pansyncer.bands import Band, DEFAULT_BANDS, normalize_bands
+# The per-module config classes are imported lazily inside Config so that
+# e.g. --help/--version never pays for evdev and the other module imports.
 
 @dataclass
 class MainConfig:
@@ -38,6 +34,15 @@ class Config:
                  rigcheck=None,
                  reconnect_scheduler=None,
                  input_hotplug=None):
+        from pansyncer.sync import SyncConfig
+        from pansyncer.device_register import DeviceRegisterConfig
+        from pansyncer.display import DisplayConfig
+        from pansyncer.knob import KnobConfig
+        from pansyncer.rigcheck import RigCheckConfig
+        from pansyncer.reconnect_scheduler import SchedulerConfig
+        from pansyncer.evdev_hotplug import InputHotplugConfig
+        from pansyncer.bands import DEFAULT_BANDS
+
         self.main = main or MainConfig()
         self.sync = sync or SyncConfig()
         self.devices = devices or DeviceRegisterConfig()
@@ -59,8 +64,35 @@ class Config:
             raise SystemExit(2) from exc
         raise SystemExit(2)
 
+    @staticmethod
+    def _read_toml_cached(path):
+        """Parse a TOML file, keeping a pickle sidecar keyed on mtime/size so
+        unchanged files skip tomllib on subsequent starts."""
+        st = os.stat(path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cache_path = path + ".cache"
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == stat_key:
+                return data
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((stat_key, data), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass                                                                        # cache is best-effort only
+        return data
+
     @classmethod
     def _load_bands(cls, data):
+        from pansyncer.bands import Band, DEFAULT_BANDS, normalize_bands
+
         tbl = data.get("bands") or {}
         if not isinstance(tbl, dict):
             cls._config_error("[bands] must be a TOML table")
@@ -87,13 +119,14 @@ class Config:
 
     @classmethod
     def from_args_and_file(cls, args):
+        from pansyncer.knob import KnobConfig
+        from pansyncer.device_register import DeviceRegisterConfig
                                                                                         # instantiate defaults
         cfg = cls()
                                                                                         # load toml file
         try:
             path = args.config_file or "pansyncer.toml"
-            with open(path, 'rb') as f:
-                data = tomllib.load(f)
+            data = cls._read_toml_cached(path)
         except FileNotFoundError:
             data = {}                                                                   # config is missing, use defaults
 
@@ -106,9 +139,10 @@ class Config:
             section_data = data.get(section_name, {})
             if isinstance(section_data, dict):
                 section_obj = getattr(cfg, section_name)
+                fields = section_obj.__dataclass_fields__
                 for key, val in section_data.items():
-                    if hasattr(section_obj, key):
-                        setattr(section_obj, key, val)
+                    if key in fields:
+                        object.__setattr__(section_obj, key, val)
 
                                                                                         # Read knobs definition
         knob_entries = data.get("knobs", [])
@@ -129,15 +163,18 @@ class Config:
 
         cfg.bands = cls._load_bands(data)                                               # Read bands
                                                                                         # overlay CLI args
+        main_fields = cfg.main.__dataclass_fields__
+        sync_fields = cfg.sync.__dataclass_fields__
+        display_fields = cfg.display.__dataclass_fields__
         for key, val in vars(args).items():
             if val is None:
                 continue
-            if hasattr(cfg.main, key):
-                setattr(cfg.main, key, val)
-            elif hasattr(cfg.sync, key):
-                setattr(cfg.sync, key, val)
-            elif hasattr(cfg.display, key):
-                setattr(cfg.display, key, val)
+            if key in main_fields:
+                object.__setattr__(cfg.main, key, val)
+            elif key in sync_fields:
+                object.__setattr__(cfg.sync, key, val)
+            elif key in display_fields:
+                object.__setattr__(cfg.display, key, val)
                                                                                         # overlay devices from args
         if args.devices is not None:
             map_ = DeviceRegisterConfig().device_map
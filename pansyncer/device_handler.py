@@ -10,6 +10,7 @@ import select
 import io
 import threading
 import errno
+from functools import partial
 
 from pansyncer.rigcheck import RigChecker
 from pansyncer.keyboard import KeyboardController
@@ -34,10 +35,12 @@ class DeviceHandler:
         self.input_hotplug_cfg = getattr(self.cfg, 'input_hotplug', InputHotplugConfig())
 
         self.interval = self.cfg.main.interval                                          # Main loop throttle
+        self._daemon = self.cfg.main.daemon                                             # Snapshot of startup invariants
         self._rigchk = None                                                             # Device controller references
         self._knob = None
         self._mouse = None
         self._input_hotplug = None
+        self._fd_cache = None                                                           # (fds, stdin, hotplug, knob, kfd, mouse, mouse_fds)
         self._lifecycle_lock = threading.RLock()
                                                                                         # Keyboard (stdin)
         if self.keyboard is None and self.devices.enabled('keyboard'):
@@ -73,11 +76,13 @@ class DeviceHandler:
     def tick(self, now):
         """Run periodic tasks, then poll FDs & dispatch events.
         Returns True if main loop should exit."""
-        self.scheduler.tick()
+        if self.scheduler.due(now):
+            self.scheduler.tick()
         return self._poll_inputs(now)
 
     def cleanup(self):
         """Release resources & stop background activities."""
+        self._invalidate_fds()
         try:
             self.scheduler.shutdown(wait=True)
         except Exception as e:
@@ -118,14 +123,16 @@ class DeviceHandler:
                                                                                         ##### INTERNAL
 
     def _register_hooks(self):                                                          # Register hooks
-        self.devices.on_add(self._on_knob_added)
-        self.devices.on_remove(self._on_knob_removed)
-        self.devices.on_add(self._on_mouse_added)
-        self.devices.on_remove(self._on_mouse_removed)
-        self.devices.on_add(self._on_rig_added)
-        self.devices.on_remove(self._on_rig_removed)
-        self.devices.on_add(self._on_gqrx_added)
-        self.devices.on_remove(self._on_gqrx_removed)
+        self.devices.on_add(self._invalidate_fds)
+        self.devices.on_remove(self._invalidate_fds)
+        self.devices.on_add(self._on_knob_added, dev='knob')
+        self.devices.on_remove(self._on_knob_removed, dev='knob')
+        self.devices.on_add(self._on_mouse_added, dev='mouse')
+        self.devices.on_remove(self._on_mouse_removed, dev='mouse')
+        self.devices.on_add(self._on_rig_added, dev='rig')
+        self.devices.on_remove(self._on_rig_removed, dev='rig')
+        self.devices.on_add(self._on_gqrx_added, dev='gqrx')
+        self.devices.on_remove(self._on_gqrx_removed, dev='gqrx')
 
     def _ensure_input_hotplug_monitor(self):
         """Start the evdev hotplug monitor if input devices may need it."""
@@ -134,6 +141,7 @@ class DeviceHandler:
                 return None
             if self._input_hotplug is None:
                 self._input_hotplug = EvdevHotplugMonitor(self.logger, self.input_hotplug_cfg)
+                self._invalidate_fds()
             return self._input_hotplug
 
     def _input_hotplug_fd(self):
@@ -150,7 +158,15 @@ class DeviceHandler:
             mouse = self._mouse if self.devices.enabled('mouse') else None
         return knob, mouse
 
-    def _poll_inputs(self, now):                                                # FD polling and event dispatch
+    def _invalidate_fds(self, _dev=None):
+        """Drop the cached FD snapshot; the next poll rebuilds it."""
+        self._fd_cache = None
+
+    def _gather_fds(self):
+        """Collect pollable FDs and a controller snapshot. The result is cached
+        until a lifecycle hook or refresh invalidates it, so FD retrieval only
+        happens on connect/disconnect instead of every tick."""
+        had_error = False
         fds = []
 
         hotplug_fd = self._input_hotplug_fd()
@@ -158,13 +174,14 @@ class DeviceHandler:
             fds.append(hotplug_fd)
 
         stdin_fd = None
-        if not self.cfg.main.daemon and self.is_tty and self.keyboard:
+        if not self._daemon and self.is_tty and self.keyboard:
             try:
                 stdin_fd = self.keyboard.get_fd()
                 fds.append(stdin_fd)
             except (io.UnsupportedOperation, ValueError) as e:
                 self.logger.log(f'stdin fd error: {e}', 'ERROR')
                 stdin_fd = None
+                had_error = True
 
         knob, mouse = self._input_controller_snapshot()
 
@@ -178,6 +195,7 @@ class DeviceHandler:
                 self.logger.log(f'knob fd error: {e}', 'ERROR')
                 self._refresh_knob_connected('fd error', controller=knob)
                 kfd = None
+                had_error = True
 
         mouse_fds = []                                                                  # Mouse FDs
         if mouse:
@@ -188,8 +206,54 @@ class DeviceHandler:
                 self.logger.log(f'mouse fds error: {e}', 'ERROR')
                 self._refresh_mouse_connected('fd error', controller=mouse, reset=True)
                 mouse_fds = []
+                had_error = True
 
         fds = list(dict.fromkeys(fds))                                                  # De-duplicate FDs
+
+        dispatch = {}                                                                   # FD -> handler(fd, now)
+        for mfd in mouse_fds:                                                           # Insertion order keeps the
+            dispatch[mfd] = partial(self._dispatch_mouse_fd, mouse)                     # stdin > knob > mouse
+        if kfd is not None and knob:                                                    # precedence on FD collisions
+            dispatch[kfd] = partial(self._dispatch_knob_fd, knob)
+        if stdin_fd is not None:
+            dispatch[stdin_fd] = self._dispatch_stdin_fd
+
+        cache = (fds, dispatch, stdin_fd, hotplug_fd, knob, kfd, mouse, mouse_fds)
+        if not had_error:                                                               # Retry failed FDs next tick
+            self._fd_cache = cache
+        return cache
+
+    def _dispatch_stdin_fd(self, fd, now):
+        """Read keyboard input; True requests main-loop exit."""
+        if self.keyboard:
+            return self.keyboard.read_stdin(fd, now)
+        return False
+
+    def _dispatch_knob_fd(self, knob, fd, now):
+        """Drain knob events for one poll cycle."""
+        try:
+            knob.handle_events(self.sync, self.step)
+        except (OSError, ValueError) as e:
+            self.logger.log(f'knob handler error: {e}', 'ERROR')
+            self._refresh_knob_connected('handler error', controller=knob)
+        return False
+
+    def _dispatch_mouse_fd(self, mouse, fd, now):
+        """Drain mouse events for one poll cycle."""
+        try:
+            mouse_active = self.keyboard.focused if self.keyboard else True
+            mouse.handle_event(fd, self.sync, self.step, now, active=mouse_active)
+        except (OSError, ValueError) as e:
+            self.logger.log(f'mouse handler error: {e}', 'ERROR')
+            self._refresh_mouse_connected('handler error', controller=mouse, reset=True)
+        return False
+
+    def _poll_inputs(self, now):                                                # FD polling and event dispatch
+        cache = self._fd_cache
+        if cache is None:
+            cache = self._gather_fds()
+        fds, dispatch, stdin_fd, hotplug_fd, knob, kfd, mouse, mouse_fds = cache
+
         if not fds:                                                                     # Nothing to poll
             time.sleep(self.interval)
             return False
@@ -217,22 +281,9 @@ class DeviceHandler:
             return False
 
         for fd in rlist:                                                               # Dispatch events
-            if stdin_fd is not None and fd == stdin_fd and self.keyboard:
-                if self.keyboard.read_stdin(fd, now):
-                    return True
-            elif kfd is not None and fd == kfd and knob:
-                try:
-                    knob.handle_events(self.sync, self.step)
-                except (OSError, ValueError) as e:
-                    self.logger.log(f'knob handler error: {e}', 'ERROR')
-                    self._refresh_knob_connected('handler error', controller=knob)
-            elif mouse and fd in mouse_fds:
-                try:
-                    mouse_active = self.keyboard.focused if self.keyboard else True
-                    mouse.handle_event(fd, self.sync, self.step, now, active=mouse_active)
-                except (OSError, ValueError) as e:
-                    self.logger.log(f'mouse handler error: {e}', 'ERROR')
-                    self._refresh_mouse_connected('handler error', controller=mouse, reset=True)
+            handler = dispatch.get(fd)
+            if handler and handler(fd, now):
+                return True
         return False
 
 
@@ -278,11 +329,14 @@ class DeviceHandler:
             with self._lifecycle_lock:
                 self.keyboard.mouse = self._mouse
 
+        self._invalidate_fds()
+
     def _ensure_knob_connected(self):
         """Reconnect knob only while it is still enabled and registered."""
         with self._lifecycle_lock:
             if not self.devices.enabled('knob') or self._knob is None:
                 return False
+            self._invalidate_fds()
             return self._knob.ensure_connected()
 
     def _ensure_mouse_connected(self):
@@ -290,10 +344,12 @@ class DeviceHandler:
         with self._lifecycle_lock:
             if not self.devices.enabled('mouse') or self._mouse is None:
                 return False
+            self._invalidate_fds()
             return self._mouse.ensure_connected()
 
     def _refresh_mouse_connected(self, reason, controller=None, reset=False):
         """Refresh mouse hardware state."""
+        self._invalidate_fds()
         with self._lifecycle_lock:
             if not self.devices.enabled('mouse') or self._mouse is None:
                 return False
@@ -307,6 +363,7 @@ class DeviceHandler:
 
     def _refresh_knob_connected(self, reason, controller=None):
         """Reset knob hardware state."""
+        self._invalidate_fds()
         with self._lifecycle_lock:
             if not self.devices.enabled('knob') or self._knob is None:
                 return False
@@ -337,6 +394,7 @@ class DeviceHandler:
 
     def _handle_bad_fds(self, stdin_fd, kfd, mouse_fds, hotplug_fd=None, knob=None, mouse=None):
         """Handle EBADF by checking each FD."""
+        self._invalidate_fds()
         if hotplug_fd is not None and not self._fd_is_valid(hotplug_fd):
             self.logger.log('evdev hotplug fd became invalid', 'ERROR')
             with self._lifecycle_lock:
@@ -436,83 +494,75 @@ class DeviceHandler:
             return self._rigchk
 
                                                                                       ##### Event handlers
-    def _on_knob_added(self, dev):
-        if dev == 'knob':
-            self._ensure_input_hotplug_monitor()
-            _ = self.knob
-            self.logger.log('Knob added', 'DEBUG')
+    def _on_knob_added(self, dev='knob'):
+        self._ensure_input_hotplug_monitor()
+        _ = self.knob
+        self.logger.log('Knob added', 'DEBUG')
 
-    def _on_knob_removed(self, dev):
-        if dev == 'knob':
-            with self._lifecycle_lock:
-                self.scheduler.unregister_tag('knob')
-                if self._knob:
-                    try:
-                        self._knob.disconnect()
-                    except (OSError, IOError) as e:
-                        self.logger.log(f'knob disconnect error: {e}', 'ERROR')
-                    self._knob = None
-                    self.logger.log('Knob removed', 'DEBUG')
+    def _on_knob_removed(self, dev='knob'):
+        with self._lifecycle_lock:
+            self.scheduler.unregister_tag('knob')
+            if self._knob:
+                try:
+                    self._knob.disconnect()
+                except (OSError, IOError) as e:
+                    self.logger.log(f'knob disconnect error: {e}', 'ERROR')
+                self._knob = None
+                self.logger.log('Knob removed', 'DEBUG')
 
-            # Start mouse again - knob presents an unused mouse
-            if self.devices.enabled('mouse'):
-                self._on_mouse_added('mouse')
+        # Start mouse again - knob presents an unused mouse
+        if self.devices.enabled('mouse'):
+            self._on_mouse_added('mouse')
 
-    def _on_mouse_added(self, dev):
-        if dev == 'mouse':
-            self._ensure_input_hotplug_monitor()
-            _ = self.mouse
-            if self.keyboard:
-                self.keyboard.mouse = self._mouse
-            self.logger.log('Mouse added', 'DEBUG')
+    def _on_mouse_added(self, dev='mouse'):
+        self._ensure_input_hotplug_monitor()
+        _ = self.mouse
+        if self.keyboard:
+            self.keyboard.mouse = self._mouse
+        self.logger.log('Mouse added', 'DEBUG')
 
-    def _on_mouse_removed(self, dev):
-        if dev == 'mouse':
-            with self._lifecycle_lock:
-                self.scheduler.unregister_tag('mouse')
-                if self._mouse:
-                    try:
-                        self._mouse.disconnect()
-                    except (OSError, IOError) as e:
-                        self.logger.log(f'mouse disconnect error: {e}', 'ERROR')
-                    if self.keyboard:
-                        self.keyboard.mouse = None
-                    self._mouse = None
-                    self.logger.log('Mouse removed', 'DEBUG')
+    def _on_mouse_removed(self, dev='mouse'):
+        with self._lifecycle_lock:
+            self.scheduler.unregister_tag('mouse')
+            if self._mouse:
+                try:
+                    self._mouse.disconnect()
+                except (OSError, IOError) as e:
+                    self.logger.log(f'mouse disconnect error: {e}', 'ERROR')
+                if self.keyboard:
+                    self.keyboard.mouse = None
+                self._mouse = None
+                self.logger.log('Mouse removed', 'DEBUG')
 
-    def _on_rig_added(self, dev):
-        if dev == 'rig':
-            _ = self.rigchk
-            self.logger.log('Rig added', 'DEBUG')
+    def _on_rig_added(self, dev='rig'):
+        _ = self.rigchk
+        self.logger.log('Rig added', 'DEBUG')
 
-    def _on_rig_removed(self, dev):
-        if dev == 'rig':
-            with self._lifecycle_lock:
-                self.scheduler.unregister_tag('rig')
+    def _on_rig_removed(self, dev='rig'):
+        with self._lifecycle_lock:
+            self.scheduler.unregister_tag('rig')
+            try:
+                self.sync.shutdown(role='rig')
+            except (OSError, IOError, RuntimeError) as e:
+                self.logger.log(f'sync rig shutdown error: {e}', 'ERROR')
+            if self._rigchk:
                 try:
-                    self.sync.shutdown(role='rig')
+                    self._rigchk.cleanup()
                 except (OSError, IOError, RuntimeError) as e:
-                    self.logger.log(f'sync rig shutdown error: {e}', 'ERROR')
-                if self._rigchk:
-                    try:
-                        self._rigchk.cleanup()
-                    except (OSError, IOError, RuntimeError) as e:
-                        self.logger.log(f'rigchk shutdown error: {e}', 'ERROR')
-                    self._rigchk = None
-                self.logger.log('Rig removed', 'DEBUG')
+                    self.logger.log(f'rigchk shutdown error: {e}', 'ERROR')
+                self._rigchk = None
+            self.logger.log('Rig removed', 'DEBUG')
 
-    def _on_gqrx_added(self, dev):
-        if dev == 'gqrx':
-            self.logger.log('GQRX added', 'INFO')
-            try:
-                self.sync.reconnect_socket(time.monotonic(), 'gqrx')
-            except (OSError, IOError, ConnectionError, TimeoutError) as e:
-                self.logger.log(f'GQRX reconnect error: {e}', 'ERROR')
+    def _on_gqrx_added(self, dev='gqrx'):
+        self.logger.log('GQRX added', 'INFO')
+        try:
+            self.sync.reconnect_socket(time.monotonic(), 'gqrx')
+        except (OSError, IOError, ConnectionError, TimeoutError) as e:
+            self.logger.log(f'GQRX reconnect error: {e}', 'ERROR')
 
-    def _on_gqrx_removed(self, dev):
-        if dev == 'gqrx':
-            self.logger.log('GQRX removed', 'INFO')
-            try:
-                self.sync.shutdown(role='gqrx')
-            except (OSError, IOError, ConnectionError, TimeoutError) as e:
-                self.logger.log(f'GQRX shutdown error: {e}', 'ERROR')
\ No newline at end of file
+    def _on_gqrx_removed(self, dev='gqrx'):
+        self.logger.log('GQRX removed', 'INFO')
+        try:
+            self.sync.shutdown(role='gqrx')
+        except (OSError, IOError, ConnectionError, TimeoutError) as e:
+            self.logger.log(f'GQRX shutdown error: {e}', 'ERROR')
\ No newline at end of file
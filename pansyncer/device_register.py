@@ -14,6 +14,45 @@ class DeviceRegisterConfig:
     device_map: Dict[str, str] = field(default_factory=lambda: {"r": "rig", "g": "gqrx", "k": "knob", "m": "mouse"})
     radios: Set[str] = field(default_factory=lambda: {"rig", "gqrx"})
 
+class _BitmaskSet(set):
+    """Device-name set that mirrors membership into an integer bitmask,
+    so enabled() checks reduce to a single AND instead of a hash lookup."""
+
+    def __init__(self, bits, iterable=()):
+        super().__init__(iterable)
+        self._bits = bits
+        self.mask = 0
+        for dev in self:
+            self.mask |= self._bit(dev)
+
+    def _bit(self, dev):
+        bit = self._bits.get(dev)
+        if bit is None:
+            bit = 1 << len(self._bits)
+            self._bits[dev] = bit
+        return bit
+
+    def add(self, dev):
+        super().add(dev)
+        self.mask |= self._bit(dev)
+
+    def discard(self, dev):
+        super().discard(dev)
+        self.mask &= ~self._bit(dev)
+
+    def remove(self, dev):
+        super().remove(dev)
+        self.mask &= ~self._bit(dev)
+
+    def update(self, *iterables):
+        super().update(*iterables)
+        for dev in self:
+            self.mask |= self._bit(dev)
+
+    def clear(self):
+        super().clear()
+        self.mask = 0
+
 class DeviceRegister:
     """Keeps track of enabled devices and notifies subscribers on changes."""
 
@@ -36,17 +75,20 @@ class DeviceRegister:
                 self.logger.log(f"Ignoring unknown devices: {', '.join(sorted(unknown))}", "WARNING")
             devs -= unknown
 
-        self._devices = devs
-        self._on_add = []
-        self._on_remove = []
+        self._bits = {dev: 1 << i for i, dev in enumerate(sorted(self._known_devices()))}
+        self._devices = _BitmaskSet(self._bits, devs)
+        self._on_add = {}                                                                          # dev -> callbacks, None = any
+        self._on_remove = {}
                                                                                                    # Subscription API
-    def on_add(self, callback):
-        """Register callback for device additions."""
-        self._on_add.append(callback)
-
-    def on_remove(self, callback):
-        """Register callback for device removals."""
-        self._on_remove.append(callback)
+    def on_add(self, callback, dev=None):
+        """Register callback for device additions.
+        With dev, the callback only fires for that device."""
+        self._on_add.setdefault(dev, []).append(callback)
+
+    def on_remove(self, callback, dev=None):
+        """Register callback for device removals.
+        With dev, the callback only fires for that device."""
+        self._on_remove.setdefault(dev, []).append(callback)
                                                                                                     # Mutation API
     def add(self, dev):
         """Enable a device and notify subscribers."""
@@ -56,7 +98,9 @@ class DeviceRegister:
 
         if dev not in self._devices:
             self._devices.add(dev)
-            for fn in self._on_add:
+            for fn in self._on_add.get(None, ()):
+                fn(dev)
+            for fn in self._on_add.get(dev, ()):
                 fn(dev)
         return True
 
@@ -68,7 +112,9 @@ class DeviceRegister:
 
         if dev in self._devices:
             self._devices.remove(dev)
-            for fn in self._on_remove:
+            for fn in self._on_remove.get(None, ()):
+                fn(dev)
+            for fn in self._on_remove.get(dev, ()):
                 fn(dev)
         return True
 
@@ -94,7 +140,7 @@ class DeviceRegister:
                                                                                                    # Query API
     def enabled(self, dev):
         """Return True if device is currently enabled."""
-        return dev in self._devices
+        return bool(self._devices.mask & self._bits.get(dev, 0))
 
     def list(self):
         """Return a snapshot of all enabled devices."""
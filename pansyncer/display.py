@@ -7,7 +7,7 @@ import time
 import threading
 import shutil
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 
 @dataclass
 class DisplayConfig:
@@ -15,10 +15,23 @@ class DisplayConfig:
     log_drop_time: float = 5.0
     input_drop_time: float = 1.0
     resize_check_interval: float = 1.0
+    frame_interval: float = 0.033
     log_lines: int = 7
     log_lines_small: int = 1
     small_display: bool = False
 
+@lru_cache(maxsize=1024)
+def _fmt_hz_cached(freq_hz):
+    """Thousand-separated Hz string for an int key; cached since the same
+    frequencies are redrawn over and over."""
+    return format(freq_hz, ',d').replace(',', '.').rjust(10)
+
+@lru_cache(maxsize=1024)
+def _freq_cell_cached(freq_hz):
+    """Ready-to-emit frequency cell: (visible width, payload with unit and reset)."""
+    freq_str = _fmt_hz_cached(freq_hz) + " Hz"
+    return len(freq_str), freq_str + "\033[0m"
+
 def synchronized(method):
     """Decorator to lock all calls to instance methods."""
     @wraps(method)
@@ -30,14 +43,11 @@ def synchronized(method):
 class Display:
     """ User Interface """
 
-    WATCHED = {
-        '_rig_freq', '_rig_status',
-        '_gqrx_freq', '_gqrx_status',
-        '_knob_connected', '_mouse_connected',
-        '_keyboard_input', '_mouse_input', '_knob_input',
-        '_sync_on', '_step_value', '_logs',
-        '_rigctld_connected', '_rig_connected', '_band_name'
-    }
+    _BLANK_INPUT = "   "                             # shared blank indicator: compares are identity-fast
+
+    _BSU = "\033[?2026h"                             # Synchronized-output (DECSET 2026): supporting terminals apply
+    _ESU = "\033[?2026l"                             # the whole frame atomically, others ignore the private mode.
+
     LABELS = {
         'rig': 'Rig',
         'gqrx': 'Gqrx',
@@ -46,14 +56,32 @@ class Display:
         'keyboard': 'Keyboard',
     }
 
+    __slots__ = (
+        'cfg', 'devices', 'rigchk',
+        '_redraw', '_lock', '_is_tty', '_frame_parts',
+        '_status_col', '_input_col', '_freq_col', '_band_width', '_mode_col',
+        '_term_cols', '_term_rows', '_resize_check_ts',
+        '_first_device_row', '_header_width', '_label_width',
+        '_status_width', '_input_width', '_header', '_header_small', '_unit',
+        '_rig_freq', '_rig_status', '_rigctld_connected', '_rig_connected',
+        '_gqrx_freq', '_gqrx_status', '_knob_connected', '_mouse_connected',
+        '_keyboard_input', '_mouse_input', '_knob_input',
+        '_sync_on', '_step_value', '_mode', '_ifreq', '_band_name',
+        '_logs', '_last_log_end_row',
+        '_keyboard_ts', '_mouse_ts', '_knob_ts', '_next_expiry', '_last_frame_ts',
+        '_blank_freq', '_blank_freq_col',
+        '_row_map', '_last_layout', '_enabled_cache', '_cell_cache', '_cup',
+        '_con_green', '_dis_red', '_sync_str', '_blank_status', '_label_frag',
+    )
+
     def __init__(self, cfg, devices, is_tty = False):
-        super().__setattr__('_redraw', True) # Redraw flag (overwrite __setattr__ to detect changes)
+        self._redraw = True                                # Redraw flag, set explicitly by the setters on change
         self._lock = threading.RLock()                     # Thread lock
         self.cfg = cfg
         self.devices = devices
+        self.rigchk = None                                 # set by DeviceHandler once the rig checker exists
         self._is_tty = is_tty
-        self._frame = ""                                   # Computed frame
-        self._frame_parts = []                             # List to store the frame-parts
+        self._frame_parts = []                             # Reusable list for the frame fragments
         self._status_col = 12                              # Columns for labels         # CON/DIS
         self._input_col = 17                                                            # UP/DWN/STP
         self._freq_col = 30                                                             # Frequency
@@ -82,9 +110,9 @@ class Display:
         self._gqrx_status = "\033[31mDIS\033[0m"
         self._knob_connected = False                                               # peripheral states
         self._mouse_connected = False
-        self._keyboard_input = "   "                                               # inputs
-        self._mouse_input = "   "
-        self._knob_input = "   "
+        self._keyboard_input = self._BLANK_INPUT                                   # inputs
+        self._mouse_input = self._BLANK_INPUT
+        self._knob_input = self._BLANK_INPUT
         self._sync_on = False                                                      # sync, step, mode, band
         self._step_value = 100
         self._mode = ""
@@ -95,9 +123,25 @@ class Display:
         self._keyboard_ts = 0.0                                                    # timestamps for auto-clear
         self._mouse_ts = 0.0
         self._knob_ts = 0.0
+        self._next_expiry = float('inf')                                           # soonest auto-clear deadline
+        self._last_frame_ts = 0.0                                                  # when the last frame was built
         width = len(self._fmt_hz(0)) + len(self._unit)                             # Precompute blank frequency
         self._blank_freq = ' ' * width
+        self._blank_freq_col = self._freq_col - width
         self._row_map = {}                                                         # layout control
+        self._last_layout = None                                                   # device rows drawn last frame
+        self._enabled_cache = None                                                 # enabled devices, None = stale
+        self._cell_cache = {}                                                      # last payload drawn per cell
+        self._cup = {}                                                             # (row, col) -> CUP escape, lazily filled
+        self._con_green = "\033[32mCON\033[0m"                                     # Precomputed payload variants
+        self._dis_red   = "\033[31mDIS\033[0m"
+        self._sync_str  = {True:  f"\033[32m{'ON ':<{self._status_width}}\033[0m",
+                           False: f"\033[31m{'OFF':<{self._status_width}}\033[0m"}
+        self._blank_status = f"{'':<{self._status_width}}"
+        self._label_frag = {dev: f" {label:<{self._label_width - 1}}"
+                            for dev, label in self.LABELS.items()}
+        self.devices.on_add(self._invalidate_devices)                              # keep enabled-set cache fresh
+        self.devices.on_remove(self._invalidate_devices)
         if self._is_tty:                                 # Set terminal. Alternate buffer, cursor to home, hide cursor
             print("\033[?1049h\033[H\033[?25l", end='')
 
@@ -107,52 +151,96 @@ class Display:
             sys.stdout.write("\033[?25h\033[?1049l")
             sys.stdout.flush()
 
-    @synchronized
+    def _emit(self, cell_id, row, col, payload):
+        """Queue CUP + payload for a cell, but only when its content changed."""
+        if self._cell_cache.get(cell_id) != payload:
+            self._cell_cache[cell_id] = payload
+            cup = self._cup.get((row, col))
+            if cup is None:
+                cup = self._cup[(row, col)] = f"\033[{row};{col}H"
+            self._frame_parts.append(cup + payload)
+
+    def _emit_raw(self, cell_id, payload):
+        """Queue a payload that carries its own cursor positioning."""
+        if self._cell_cache.get(cell_id) != payload:
+            self._cell_cache[cell_id] = payload
+            self._frame_parts.append(payload)
+
     def draw(self, now):
-        """  Build one frame and print it """
+        """  Build one frame and print the changed cells """
+        with self._lock:                              # Hold the lock only to expire state and snapshot it; the frame
+            if not self._redraw and now < self._next_expiry:                       # build and stdout write run
+                return                                                             # unlocked so setters on I/O
+                                                                                   # threads never wait on a frame.
+            if now - self._last_frame_ts < self.cfg.display.frame_interval:        # Coalesce input storms: the flag
+                return                                                             # stays set, next tick repaints.
+            self._last_frame_ts = now
+            logs = self._logs                                                      # Check time-based deletions.
+            drop = self.cfg.display.log_drop_time                                  # Newest entry sits at the front,
+            expired = False                                                        # so expiry pops from the tail.
+            while logs and now - logs[-1][1] >= drop:
+                logs.pop()
+                expired = True
+            if logs and now - logs[0][1] >= drop:                                  # out-of-order timestamps: filter
+                self._logs = [item for item in logs if now - item[1] < drop]
+                expired = True
+            if expired:
+                self._redraw = True
+
+            if now - self._keyboard_ts >= self.cfg.display.input_drop_time and self._keyboard_input != self._BLANK_INPUT:
+                self._keyboard_input = self._BLANK_INPUT
+                self._redraw = True
+            if now - self._mouse_ts >= self.cfg.display.input_drop_time and self._mouse_input != self._BLANK_INPUT:
+                self._mouse_input = self._BLANK_INPUT
+                self._redraw = True
+            if now - self._knob_ts >= self.cfg.display.input_drop_time and self._knob_input != self._BLANK_INPUT:
+                self._knob_input = self._BLANK_INPUT
+                self._redraw = True
+
+            self._recompute_next_expiry()
+
+            if not self._redraw:                                                   # Do not draw if nothing has changed
+                return
+            self._redraw = False
+                                                                                   # Snapshot everything the setters
+            logs = list(self._logs)                                                # touch; draw reads only locals
+            mode = self._mode                                                      # from here on.
+            ifreq = self._ifreq
+            step_value = self._step_value
+            sync_on = self._sync_on
+            rig_status = self._rig_status
+            rig_freq = self._rig_freq
+            gqrx_status = self._gqrx_status
+            gqrx_freq = self._gqrx_freq
+            knob_connected = self._knob_connected
+            mouse_connected = self._mouse_connected
+            knob_input = self._knob_input
+            mouse_input = self._mouse_input
+            keyboard_input = self._keyboard_input
+            band_name = self._band_name
 
-        @synchronized
-        def draw(self, now):
-            """Build one frame and print it."""
-        if not self._redraw and not self._timed_redraw_due(now):
-            return
         old_base = (max(self._row_map.values()) + 1) if self._row_map else (       # Remember log base row
             2 if self.cfg.display.small_display else 4)
-        new_logs = [                                                               # Check time-based deletions
-            (msg, ts)
-            for (msg, ts) in self._logs
-            if now - ts < self.cfg.display.log_drop_time
-        ]
-        if new_logs != self._logs:
-            self._logs = new_logs
-
-        if now - self._keyboard_ts >= self.cfg.display.input_drop_time and self._keyboard_input.strip():
-            self._keyboard_input = "   "
-        if now - self._mouse_ts >= self.cfg.display.input_drop_time and self._mouse_input.strip():
-            self._mouse_input = "   "
-        if now - self._knob_ts >= self.cfg.display.input_drop_time and self._knob_input.strip():
-            self._knob_input = "   "
-
-        if not self._redraw:                                                       # Do not draw if nothing has changed
-            return
-        self._redraw = False
-
         self._frame_parts.clear()                                                  # start new frame
-        self._frame_parts.append("\033[H")                                         # move cursor to home
 
         small = self.cfg.display.small_display                                     # draw header
-        self._frame_parts.append(self._header_small if small else self._header)
+        self._emit_raw('header', self._header_small if small else self._header)
         first_device_row = 2 if small else 4
 
-        if self.cfg.display.small_display:                     # only radio devices in small_display
-            device_rows = [(k, self.LABELS[k]) for k in ('rig', 'gqrx') if self.devices.enabled(k)]
+        enabled = self._enabled_cache                                              # register hooks invalidate this,
+        if enabled is None:                                                        # so most frames reuse the set
+            enabled = self._enabled_cache = self.devices.list()
+        if small:                                              # only radio devices in small_display
+            device_rows = [(k, self.LABELS[k]) for k in ('rig', 'gqrx') if k in enabled]
         else:
-            device_rows = [(k, v) for (k, v) in self.LABELS.items() if self.devices.enabled(k)]
+            device_rows = [(k, v) for (k, v) in self.LABELS.items() if k in enabled]
 
 
-        old_count = len(self._row_map)                                             # clear if row count changed
-        new_count = len(device_rows)
-        if new_count != old_count:
+        old_count = len(self._row_map)                                             # clear if any row moved, not just
+        new_count = len(device_rows)                                               # on count change: equal-count
+        if device_rows != self._last_layout or not self._row_map:                  # swaps shift rows too
+            self._cell_cache.clear()                                               # layout shifted: repaint everything
+            self._cell_cache['header'] = self._header_small if small else self._header
             for r in range(first_device_row + min(old_count, new_count),
                            first_device_row + max(old_count, new_count)):
                 self._frame_parts.append(f"\033[{r};1H\033[K")
@@ -160,90 +248,103 @@ class Display:
                 self._frame_parts.append(
                     f"\033[{r};{self._status_col}H{'':{self._status_width}}"
                     f"\033[{r};{self._input_col}H{'':{self._input_width}}")
+            self._last_layout = device_rows
+            self._row_map.clear()
+            for row, (dev, label) in enumerate(device_rows, start=first_device_row):
+                self._row_map[dev] = row
+                self._emit(('label', row), row, 1, self._label_frag[dev])
 
-        self._row_map.clear()                                                      # rebuild row map for device rows
-        for row, (dev, label) in enumerate(device_rows, start=first_device_row):
-            self._row_map[dev] = row
-            self._frame_parts.append(f"\033[{row};1H {label:<{self._label_width - 1}}")
+        if not small:                                                              # Mode label
+            self._emit('mode', 1, self._mode_col, f"\033[96m{mode}\033[0m")
 
-        if not self.cfg.display.small_display: # Mode label
-            self._frame_parts.append(f"\033[1;{self._mode_col}H\033[96m{self._mode}\033[0m")
-
-        if not self.cfg.display.small_display:
+        if not small:
             sync_status_row = 2
             step_freq_row = 3
-            if self._ifreq is not None:
-                self._draw_freq(2, self._ifreq)                               # iFreq
+            if ifreq is not None:                                                  # iFreq
+                width, cell = _freq_cell_cached(int(ifreq))
+                self._emit('ifreq', 2, self._freq_col - width, cell)
         else:
             sync_status_row = 1
             step_freq_row = 1
 
-        self._draw_freq(step_freq_row, self._step_value)                           # Step frequency
+        width, cell = _freq_cell_cached(int(step_value))                           # Step frequency
+        self._emit('step_freq', step_freq_row, self._freq_col - width, cell)
 
-        status = "ON " if self._sync_on else "OFF"                                 # Sync status
-        color = "32" if self._sync_on else "31"
-        self._frame_parts.append(
-            f"\033[{sync_status_row};{self._status_col}H\033[{color}m{status:<{self._status_width}}\033[0m")
+        self._emit('sync', sync_status_row, self._status_col,                      # Sync status
+                   self._sync_str[bool(sync_on)])
 
-        if self.devices.enabled('rig'):                                           # Rig
+        if 'rig' in enabled:                                                      # Rig
             r = self._row_map['rig']
-            self._frame_parts.append(f"\033[{r};{self._status_col}H{self._rig_status}")
-            self._draw_freq(r, self._rig_freq)
+            self._emit(('status', r), r, self._status_col, rig_status)
+            if rig_freq is None:
+                self._emit('rig_freq', r, self._blank_freq_col, self._blank_freq)
+            else:
+                width, cell = _freq_cell_cached(int(rig_freq))
+                self._emit('rig_freq', r, self._freq_col - width, cell)
 
-        if self.devices.enabled('gqrx'):                                          # Gqrx
+        if 'gqrx' in enabled:                                                     # Gqrx
             r = self._row_map['gqrx']
-            self._frame_parts.append(f"\033[{r};{self._status_col}H{self._gqrx_status}")
-            self._draw_freq(r, self._gqrx_freq)
+            self._emit(('status', r), r, self._status_col, gqrx_status)
+            if gqrx_freq is None:
+                self._emit('gqrx_freq', r, self._blank_freq_col, self._blank_freq)
+            else:
+                width, cell = _freq_cell_cached(int(gqrx_freq))
+                self._emit('gqrx_freq', r, self._freq_col - width, cell)
 
-        if not self.cfg.display.small_display:
-            if self.devices.enabled('knob'):                                       # Knob
+        if not small:
+            if 'knob' in enabled:                                                  # Knob
                 r = self._row_map['knob']
-                color = "32" if self._knob_connected else "31"
-                self._frame_parts.append(f"\033[{r};{self._status_col}H\033[{color}m{'CON' if self._knob_connected else 'DIS'}\033[0m")
-                self._frame_parts.append(f"\033[{r};{self._input_col}H{self._knob_input:<3}")
+                self._emit(('status', r), r, self._status_col,
+                           self._con_green if knob_connected else self._dis_red)
+                self._emit(('input', r), r, self._input_col, knob_input.ljust(3))
 
-            if self.devices.enabled('mouse'):                                      # Mouse
+            if 'mouse' in enabled:                                                 # Mouse
                 r = self._row_map['mouse']
-                color = "32" if self._mouse_connected else "31"
-                self._frame_parts.append(f"\033[{r};{self._status_col}H\033[{color}m{'CON' if self._mouse_connected else 'DIS'}\033[0m")
-                self._frame_parts.append(f"\033[{r};{self._input_col}H{self._mouse_input:<3}")
+                self._emit(('status', r), r, self._status_col,
+                           self._con_green if mouse_connected else self._dis_red)
+                self._emit(('input', r), r, self._input_col, mouse_input.ljust(3))
 
             keyboard_row = self._row_map.get('keyboard')                           # Keyboard (always enabled)
             if keyboard_row is not None:
                 r = keyboard_row
-                self._frame_parts.append(f"\033[{r};{self._status_col}H{'':<{self._status_width}}")
-                self._frame_parts.append(f"\033[{r};{self._input_col}H{self._keyboard_input:<3}")
-                col = self._freq_col - len(self._band_name)                        # Band name
-                self._frame_parts.append(f"\033[{r};{col}H\033[1;96m{self._band_name}\033[0m")
+                self._emit(('status', r), r, self._status_col, self._blank_status)
+                self._emit(('input', r), r, self._input_col, keyboard_input.ljust(3))
+                col = self._freq_col - len(band_name)                              # Band name
+                self._emit('band', r, col, f"\033[1;96m{band_name}\033[0m")
 
         base_row = max(self._row_map.values()) + 1 if self._row_map else first_device_row # Logs
                                                                                    # One line log in small_display
-        display_log_lines = self.cfg.display.log_lines_small if self.cfg.display.small_display else self.cfg.display.log_lines
+        display_log_lines = self.cfg.display.log_lines_small if small else self.cfg.display.log_lines
         if base_row > old_base:                                                    # Clear on log pushdown (device add)
             for clear_row in range(old_base, base_row):
                 if clear_row not in self._row_map.values():
-                    self._frame_parts.append(f"\033[{clear_row};1H\033[K")
-        count = len(self._logs)
+                    self._emit(('log', clear_row), clear_row, 1, "\033[K")
+        count = len(logs)
         for idx in range(display_log_lines):
             row = base_row + idx
-            if idx < count:
-                if self.cfg.display.small_display:
-                    line = self._logs[idx][0].splitlines()[0]
+            if idx < count:                                                        # log() stores single lines,
+                if small:                                                          # no re-split needed here
+                    line = logs[idx][0]
                 else:
-                    line = self._logs[count - 1 - idx][0].splitlines()[0]
-                self._frame_parts.append(f"\033[{row};1H\033[K{line}")
+                    line = logs[count - 1 - idx][0]
+                self._emit(('log', row), row, 1, f"\033[K{line}")
             else:
-                self._frame_parts.append(f"\033[{row};1H\033[K")
+                self._emit(('log', row), row, 1, "\033[K")
 
         log_end_row = base_row + display_log_lines - 1                            # If logs moved up, because of
         if self._last_log_end_row > log_end_row:                                  # device removal: Clear last line
             for row in range(log_end_row + 1, self._last_log_end_row + 1):
-                self._frame_parts.append(f"\033[{row};1H\033[K")
+                self._emit(('log', row), row, 1, "\033[K")
         self._last_log_end_row = log_end_row
 
-        self._frame = "".join(self._frame_parts)                            # Put frame together and write it to screen
-        sys.stdout.write(self._frame)
+        if not self._frame_parts:                                                 # Every cell unchanged
+            return
+        frame = "".join(self._frame_parts)                                  # Put frame together and write it to screen
+        if self._is_tty:
+            frame = self._BSU + frame + self._ESU
+        sys.stdout.write(frame)
         sys.stdout.flush()
+        self._frame_parts.clear()                                                 # drop fragment refs until next frame
 
     @synchronized
     def check_resize(self, now):
@@ -267,9 +368,19 @@ class Display:
 
         self._last_log_end_row = 0
         self._row_map.clear()
-        super().__setattr__('_redraw', True)
+        self._cell_cache.clear()
+        self._redraw = True
         return True
 
+    def _mark_dirty(self):
+        """Request a repaint on the next draw."""
+        self._redraw = True
+
+    def _invalidate_devices(self, _dev=None):
+        """Drop the cached enabled-device set after a register change."""
+        self._enabled_cache = None
+        self._redraw = True
+
     @synchronized
     def set_mode(self, mode: str):
         """Set the mode label (e.g., 'iFreq' or 'Direct')."""
@@ -283,139 +394,154 @@ class Display:
     @synchronized
     def set_sync_mode(self, on: bool):
         """Set Sync mode On/Off"""
-        self._sync_on = on
+        if on != self._sync_on:
+            self._sync_on = on
+            self._mark_dirty()
 
     @synchronized
     def set_step_value(self, step):
         """Set frequency increment"""
-        self._step_value = step
+        if step != self._step_value:
+            self._step_value = step
+            self._mark_dirty()
 
     @synchronized
     def set_rig_con(self, rig_connected):
         """Set rig connection status (CON in green)"""
-        self._rig_connected = rig_connected
+        if rig_connected != self._rig_connected:
+            self._rig_connected = rig_connected
+            self._mark_dirty()
         self.set_rig(self._rig_freq, self._rigctld_connected)
 
     @synchronized
     def set_rig(self, freq, rigctl_connected):
         """Set rig frequency and status"""
-        self._rigctld_connected = rigctl_connected
-        self._rig_freq = freq
+        if rigctl_connected != self._rigctld_connected or freq != self._rig_freq:
+            self._rigctld_connected = rigctl_connected
+            self._rig_freq = freq
+            self._mark_dirty()
 
         if self._rigctld_connected and self._rig_connected:                       # RIG connected to rigctl
-            self._rig_status = "\033[32mCON\033[0m"
+            status = self._con_green
         elif self._rigctld_connected:                                             # rigctl connected, no RIG
-            self._rig_status = "CON"
+            status = "CON"
         else:                                                                     # rigctl disconnected
-            self._rig_status = "\033[31mDIS\033[0m"
+            status = self._dis_red
+        if status != self._rig_status:
+            self._rig_status = status
+            self._mark_dirty()
 
     @synchronized
     def set_gqrx(self, freq, connected):
         """Set Gqrx frequency and status"""
-        self._gqrx_freq = freq
-        self._gqrx_status = "\033[32mCON\033[0m" if connected else "\033[31mDIS\033[0m"
+        status = self._con_green if connected else self._dis_red
+        if freq != self._gqrx_freq or status != self._gqrx_status:
+            self._gqrx_freq = freq
+            self._gqrx_status = status
+            self._mark_dirty()
 
     @synchronized
     def set_knob(self, connected=True):
         """Set Knob status"""
-        self._knob_connected = connected
+        if connected != self._knob_connected:
+            self._knob_connected = connected
+            self._mark_dirty()
 
     @synchronized
     def set_mouse(self, connected: bool):
         """Set Mouse status"""
-        self._mouse_connected = connected
+        if connected != self._mouse_connected:
+            self._mouse_connected = connected
+            self._mark_dirty()
 
     @synchronized
     def set_keyboard_input(self, text: str):
         """Set keyboard input indicator and timestamp for deletion"""
-        self._keyboard_input = text[:3]
+        text = text[:3]
+        if text != self._keyboard_input:
+            self._keyboard_input = text
+            self._mark_dirty()
         self._keyboard_ts = time.monotonic()
+        self._push_expiry(self._keyboard_ts + self.cfg.display.input_drop_time)
 
     @synchronized
     def set_band_name(self, name: str):
         """Set the band label"""
-        self._band_name = (name or "").rjust(self._band_width)[:self._band_width]
+        name = (name or "").rjust(self._band_width)[:self._band_width]
+        if name != self._band_name:
+            self._band_name = name
+            self._mark_dirty()
 
     @synchronized
     def set_mouse_input(self, text: str):
         """Set mouse input indicator and timestamp for deletion"""
-        self._mouse_input = text[:3]
+        text = text[:3]
+        if text != self._mouse_input:
+            self._mouse_input = text
+            self._mark_dirty()
         self._mouse_ts = time.monotonic()
+        self._push_expiry(self._mouse_ts + self.cfg.display.input_drop_time)
 
     @synchronized
     def set_knob_input(self, text: str):
         """Set knob input indicator and timestamp for deletion"""
-        self._knob_input = text[:3]
+        text = text[:3]
+        if text != self._knob_input:
+            self._knob_input = text
+            self._mark_dirty()
         self._knob_ts = time.monotonic()
+        self._push_expiry(self._knob_ts + self.cfg.display.input_drop_time)
 
     @synchronized
     def toggle_small_display(self):
         """Toggle compact UI and trigger a repaint."""
         self.cfg.display.small_display = not self.cfg.display.small_display
         self._row_map.clear()
+        self._cell_cache.clear()
         self._last_log_end_row = 0
         if self._is_tty:
             sys.stdout.write("\033[2J\033[H")                                         # Clear screen and redraw on toggle
             sys.stdout.flush()
-        super().__setattr__('_redraw', True)
+        self._redraw = True
 
     @synchronized
     def log(self, text: str):
         """ log display """
         try:
             logline = text.split('\n', 1)[0]                         # only use the first line
-            self._logs.insert(0, (logline, time.monotonic()))      # push newest message to front
+            ts = time.monotonic()
+            self._logs.insert(0, (logline, ts))                    # push newest message to front
+            self._push_expiry(ts + self.cfg.display.log_drop_time)
                                                                                   # small display log line limit
             limit = self.cfg.display.log_lines_small if self.cfg.display.small_display else self.cfg.display.log_lines
             if len(self._logs) > limit:                                           # keep only the most recent
                 self._logs.pop()
-            super().__setattr__('_redraw', True)
+            self._redraw = True
         except (AttributeError, TypeError) as e:
             print(f"PanSyncer Display log error  {e}", file=sys.stderr)
             return
-    def _timed_redraw_due(self, now):
-        """Return True if time-based UI cleanup requires a redraw."""
+    def _push_expiry(self, deadline):
+        """Pull the cached auto-clear deadline forward to the given time."""
+        if deadline < self._next_expiry:
+            self._next_expiry = deadline
+
+    def _recompute_next_expiry(self):
+        """Recompute the soonest pending auto-clear deadline, inf if none."""
+        deadline = float('inf')
         if self._logs:
-            for _, ts in self._logs:
-                if now - ts >= self.cfg.display.log_drop_time:
-                    return True
-        if self._keyboard_input.strip() and now - self._keyboard_ts >= self.cfg.display.input_drop_time:
-            return True
-        if self._mouse_input.strip() and now - self._mouse_ts >= self.cfg.display.input_drop_time:
-            return True
-        if self._knob_input.strip() and now - self._knob_ts >= self.cfg.display.input_drop_time:
-            return True
-        return False
-
-    def _draw_freq(self, row, freq = None, style = ""):
-        """ Draw a frequency string with unit """
-        if freq is None:
-            start_col = self._freq_col - len(self._blank_freq)
-            self._frame_parts.append(f"\033[{row};{start_col}H{self._blank_freq}")
-        else:
-            freq_str = self._fmt_hz(freq) + self._unit
-            start_col = self._freq_col - len(freq_str)
-            self._frame_parts.append(f"\033[{row};{start_col}H{style}{freq_str}\033[0m")
+            deadline = min(ts for _, ts in self._logs) + self.cfg.display.log_drop_time
+        drop = self.cfg.display.input_drop_time
+        if self._keyboard_input != self._BLANK_INPUT:
+            deadline = min(deadline, self._keyboard_ts + drop)
+        if self._mouse_input != self._BLANK_INPUT:
+            deadline = min(deadline, self._mouse_ts + drop)
+        if self._knob_input != self._BLANK_INPUT:
+            deadline = min(deadline, self._knob_ts + drop)
+        self._next_expiry = deadline
 
     @staticmethod
     def _fmt_hz(freq):
         """ Frequency format """
         if freq is None:
             return ' ' * 10
-        s = f"{int(freq):,}".replace(",", ".")                        # Insert dots every three digits
-        return s.rjust(10)                                                        # Right-justify to field width 10
-
-    def __setattr__(self, name, value):
-        """ Sets the redraw flag if one of the watched attributes change"""
-        if name == '_lock':
-            super().__setattr__(name, value)
-            return
-        with self._lock:
-            if name == '_redraw':
-                super().__setattr__(name, value)
-                return
-            if name in self.WATCHED:
-                old = getattr(self, name, None)
-                if value != old:
-                    super().__setattr__('_redraw', True)
-            super().__setattr__(name, value)
+        return _fmt_hz_cached(int(freq))                              # Insert dots every three digits, width 10
@@ -5,7 +5,7 @@ then processes a single character.
 """
 import sys
 import os
-from pansyncer.utils import beep
+from pansyncer.utils import beep, NULL_DISPLAY
 
 class KeyboardController:
     """ Keyboard event handling via stdin """
@@ -16,7 +16,7 @@ class KeyboardController:
         self.sync     = sync
         self.logger   = logger
         self.step     = step
-        self.display  = display
+        self.display  = display if display is not None else NULL_DISPLAY
         self.mouse    = mouse
         self._fd      = sys.stdin.fileno()
         self.focused  = True
@@ -38,7 +38,7 @@ class KeyboardController:
     def read_stdin(self, fd, now):
         """ Read raw data from stdin do detect Escape-Sequences """
         try:
-            chunk = os.read(fd, 32)                                              # read up to 32 bytes
+            chunk = os.read(fd, 512)                     # one big read drains key-repeat and paste bursts in one wakeup
         except OSError as e:
             self.logger.log(f"stdin read error: {e}", "ERROR")
             return True
@@ -49,6 +49,8 @@ class KeyboardController:
         i = 0
         data = self._input_buf
         l = len(data)
+        mouse = self.mouse
+        wheel_debounce = self.interval * 4                                            # computed once per wakeup
         while i < l:
             remaining = l - i
             if data[i] == 0x1b:
@@ -82,14 +84,12 @@ class KeyboardController:
                         self.logger.log("Window Lost focus", "DEBUG")
                     elif code == ord('A'):                                            # Up arrow
                         # Some terminals bind mouse-wheel to up/down, so we do a time-based debounce on arrow keys.
-                        if not (self.mouse and (
-                                now - getattr(self.mouse, 'last_scroll_time', 0) < (self.interval * 4))):
+                        if not (mouse and now - mouse.last_scroll_time < wheel_debounce):
                             if self.handle_events('+') == 'quit':
                                 del data[:i + seq_len]
                                 return True
                     elif code == ord('B'):                                            # Down arrow
-                        if not (self.mouse and (
-                                now - getattr(self.mouse, 'last_scroll_time', 0) < (self.interval * 4))):
+                        if not (mouse and now - mouse.last_scroll_time < wheel_debounce):
                             if self.handle_events('-') == 'quit':
                                 del data[:i + seq_len]
                                 return True
@@ -101,8 +101,8 @@ class KeyboardController:
                 i += 1
                 continue
 
-            ch = chr(data[i])                                                         # normal byte – process as character
-            if self.handle_events(ch) == "quit":
+            handler = self._ACTIONS_BY_BYTE.get(data[i])                              # normal byte – dispatch directly,
+            if handler is not None and handler(self) == "quit":                       # no chr() round-trip
                 del data[:i + 1]
                 return True
             i += 1
@@ -112,112 +112,119 @@ class KeyboardController:
 
     def handle_events(self, key: str = None):
         """Parse a key press and execute the corresponding action."""
-
         if key is None:
-            return
-                                                                                        # Help
-        elif key == '?':
-            self.logger.log("Change Frequency :  + / -, arrow keys, mouse or external VFO Knob", "INFO")
-            self.logger.log("Sync On / Off    :  1 / 0", "INFO")
-            self.logger.log("Change Step      :  Spacebar, middle mouse button or knob click", "INFO")
-            self.logger.log("Toggle devices   :  r = Rig,  g = Gqrx, m = Mouse, k = VFO Knob", "INFO")
-            self.logger.log("Change Band      :  w = Up,  s = Down", "INFO")
-            self.logger.log("Toggle display   :  d", "INFO")
-            self.logger.log("Quit             :  q ", "INFO")
-                                                                                       # Switch sync ON
-        elif key == '1':
-
-            rig = self.sync.radio['rig']
-            gqrx = self.sync.radio['gqrx']
-            rig_ok = (
-                    rig['sock'] is not None
-                    and rig['connected']
-                    and self.devices.enabled('rig')
-            )
-            gqrx_ok = (
-                    gqrx['sock'] is not None
-                    and gqrx['connected']
-                    and self.devices.enabled('gqrx')
-            )
-            if rig_ok and gqrx_ok:
-                self.sync.set_sync_mode(True)
-                if self.display: self.display.set_sync_mode(True)
-                self.logger.log('Sync ON', 'INFO')
-            else:
-                self.sync.set_sync_mode(False)
-                if self.display:
-                    self.display.set_sync_mode(False)
-                self.logger.log('Cannot enable sync – both Rig and Gqrx must be connected.', 'ERROR')
-                beep()
             return None
-                                                                                        # Switch sync OFF
-        if key == '0':
-            self.sync.set_sync_mode(False)
-            if self.display: self.display.set_sync_mode(False)
-            self.logger.log('Sync OFF', 'INFO')
+        handler = self._ACTIONS.get(key)                                                # single table lookup
+        if handler is None:
             return None
-
+        return handler(self)
+                                                                                        # Help
+    def _key_help(self):
+        self.logger.log("Change Frequency :  + / -, arrow keys, mouse or external VFO Knob", "INFO")
+        self.logger.log("Sync On / Off    :  1 / 0", "INFO")
+        self.logger.log("Change Step      :  Spacebar, middle mouse button or knob click", "INFO")
+        self.logger.log("Toggle devices   :  r = Rig,  g = Gqrx, m = Mouse, k = VFO Knob", "INFO")
+        self.logger.log("Change Band      :  w = Up,  s = Down", "INFO")
+        self.logger.log("Toggle display   :  d", "INFO")
+        self.logger.log("Quit             :  q ", "INFO")
+                                                                                        # Switch sync ON
+    def _key_sync_on(self):
+        radio = self.sync.radio
+        enabled = self.devices.enabled
+        rig = radio['rig']
+        gqrx = radio['gqrx']
+        rig_ok = (                                                                      # cheapest check first
+                enabled('rig')
+                and rig['connected']
+                and rig['sock'] is not None
+        )
+        gqrx_ok = (
+                enabled('gqrx')
+                and gqrx['connected']
+                and gqrx['sock'] is not None
+        )
+        if rig_ok and gqrx_ok:
+            self.sync.set_sync_mode(True)
+            self.display.set_sync_mode(True)
+            self.logger.log('Sync ON', 'INFO')
+        else:
+            self.sync.set_sync_mode(False)
+            self.display.set_sync_mode(False)
+            self.logger.log('Cannot enable sync – both Rig and Gqrx must be connected.', 'ERROR')
+            beep()
+                                                                                        # Switch sync OFF
+    def _key_sync_off(self):
+        self.sync.set_sync_mode(False)
+        self.display.set_sync_mode(False)
+        self.logger.log('Sync OFF', 'INFO')
                                                                                         # Nudge frequency
-        if key == '+':
-            self.sync.nudge(self.step.get_step())
-            if self.display: self.display.set_keyboard_input('UP ')
-        elif key == '-':
-            self.sync.nudge(-self.step.get_step())
-            if self.display: self.display.set_keyboard_input('DWN')
+    def _key_nudge_up(self):
+        self.sync.nudge(self.step.get_step())
+        self.display.set_keyboard_input('UP ')
 
+    def _key_nudge_down(self):
+        self.sync.nudge(-self.step.get_step())
+        self.display.set_keyboard_input('DWN')
                                                                                         # Cycle step size
-        elif key == ' ':
-            self.step.next_step()
-            if self.display: self.display.set_step_value(self.step.get_step())
-            if self.display: self.display.set_keyboard_input('STP')
-
-                                                                                        # Toggle Gqrx
-        if key.upper() == 'G':
-            self.devices.toggle('gqrx')
-            state = 'ENABLED' if self.devices.enabled('gqrx') else 'DISABLED'
-            if self.display: self.display.set_keyboard_input('GQR')
-            self.logger.log(f"[DEVICE] GQRX {state}", "DEBUG")
-
-                                                                                        # Toggle rig
-        elif key.upper() == 'R':
-            self.devices.toggle('rig')
-            state = 'ENABLED' if self.devices.enabled('rig') else 'DISABLED'
-            if self.display: self.display.set_keyboard_input('RIG')
-            self.logger.log(f"[DEVICE] RIG {state}", "DEBUG")
-
-                                                                                        # Toggle Knob
-        elif key.upper() == 'K':
-            self.devices.toggle('knob')
-            state = 'ENABLED' if self.devices.enabled('knob') else 'DISABLED'
-            if self.display: self.display.set_keyboard_input('KNB')
-            self.logger.log(f"[DEVICE] KNOB {state}", "DEBUG")
-
-                                                                                        # Toggle Mouse
-        elif key.upper() == 'M':
-            self.devices.toggle('mouse')
-            state = 'ENABLED' if self.devices.enabled('mouse') else 'DISABLED'
-            if self.display: self.display.set_keyboard_input('MSE')
-            self.logger.log(f"[DEVICE] MOUSE {state}", "DEBUG")
-                                                                                        # Band up
-        elif key.upper() == 'W':
-            self.sync.band_step(1)
-            if self.display: self.display.set_keyboard_input('BUP')
-            self.logger.log("Band up", "INFO")
-                                                                                        # Band down
-        elif key.upper() == 'S':
-            self.sync.band_step(-1)
-            if self.display: self.display.set_keyboard_input('BDN')
-            self.logger.log("Band down", "INFO")
+    def _key_next_step(self):
+        self.step.next_step()
+        self.display.set_step_value(self.step.get_step())
+        self.display.set_keyboard_input('STP')
+
+    def _key_toggle_device(self, dev, indicator, label):
+        self.devices.toggle(dev)
+        state = 'ENABLED' if self.devices.enabled(dev) else 'DISABLED'
+        self.display.set_keyboard_input(indicator)
+        self.logger.log(f"[DEVICE] {label} {state}", "DEBUG")
+
+    def _key_toggle_gqrx(self):
+        self._key_toggle_device('gqrx', 'GQR', 'GQRX')
+
+    def _key_toggle_rig(self):
+        self._key_toggle_device('rig', 'RIG', 'RIG')
+
+    def _key_toggle_knob(self):
+        self._key_toggle_device('knob', 'KNB', 'KNOB')
+
+    def _key_toggle_mouse(self):
+        self._key_toggle_device('mouse', 'MSE', 'MOUSE')
+                                                                                        # Band up / down
+    def _key_band_up(self):
+        self.sync.band_step(1)
+        self.display.set_keyboard_input('BUP')
+        self.logger.log("Band up", "INFO")
+
+    def _key_band_down(self):
+        self.sync.band_step(-1)
+        self.display.set_keyboard_input('BDN')
+        self.logger.log("Band down", "INFO")
                                                                                         # Toggle Display
-        elif key.upper() == 'D':
-            if self.display:
-                self.display.toggle_small_display()
-                state = 'SMALL' if self.display.cfg.display.small_display else 'FULL'
-                if self.display: self.display.set_keyboard_input('DSP')
-                self.logger.log(f"[DISPLAY TOGGLE] {state}", "DEBUG")
+    def _key_toggle_display(self):
+        if self.display:
+            self.display.toggle_small_display()
+            state = 'SMALL' if self.display.cfg.display.small_display else 'FULL'
+            self.display.set_keyboard_input('DSP')
+            self.logger.log(f"[DISPLAY TOGGLE] {state}", "DEBUG")
                                                                                         # Quit command
-        elif key.upper() == 'Q':
-            if self.display: self.display.set_keyboard_input('EXT')
-            return 'quit'
-
-        return None
+    def _key_quit(self):
+        self.display.set_keyboard_input('EXT')
+        return 'quit'
+
+    _ACTIONS = {                                                                        # key -> action, built once at
+        '?': _key_help,                                                                 # class creation; both cases
+        '1': _key_sync_on,                                                              # mapped for letter keys
+        '0': _key_sync_off,
+        '+': _key_nudge_up,
+        '-': _key_nudge_down,
+        ' ': _key_next_step,
+        'g': _key_toggle_gqrx, 'G': _key_toggle_gqrx,
+        'r': _key_toggle_rig, 'R': _key_toggle_rig,
+        'k': _key_toggle_knob, 'K': _key_toggle_knob,
+        'm': _key_toggle_mouse, 'M': _key_toggle_mouse,
+        'w': _key_band_up, 'W': _key_band_up,
+        's': _key_band_down, 'S': _key_band_down,
+        'd': _key_toggle_display, 'D': _key_toggle_display,
+        'q': _key_quit, 'Q': _key_quit,
+    }
+
+    _ACTIONS_BY_BYTE = {ord(key): action for key, action in _ACTIONS.items()}           # raw-byte view for read_stdin
@@ -10,6 +10,8 @@ from typing import List
 
 from evdev import InputDevice, list_devices, ecodes
 
+from pansyncer.utils import NULL_DISPLAY
+
 
 @dataclass
 class KnobConfig:
@@ -26,16 +28,22 @@ class KnobConfig:
 
 DEFAULT_KNOB_CONFIGS: List[KnobConfig] = [KnobConfig()]
 
+_EV_KEY = ecodes.EV_KEY                                # hoisted: one global load per event instead of two attr chains
+
 
 class KnobController:
     """Connection handling and event reading for external VFO device."""
 
+    _code_map = None                                   # key-code dispatch, rebuilt when the active config changes
+    _map_cfg = None
+
     def __init__(self, cfg, logger, display=None):
         self.cfg = cfg
-        self.display = display
+        self.display = display if display is not None else NULL_DISPLAY
         self.logger = logger
         self.dev = None
         self.active_cfg = None
+        self.cached_fd = None
         if not hasattr(self.cfg, "knobs") or not self.cfg.knobs:
             self.cfg.knobs = DEFAULT_KNOB_CONFIGS
 
@@ -50,8 +58,8 @@ class KnobController:
         if not self.dev:
             return False
 
-        if self.display:
-            self.display.set_knob(True)
+        self.cached_fd = self.dev.fd
+        self.display.set_knob(True)
         self.logger.log(f"VFO-Knob connected: {self.dev.name}", "INFO")
         return True
 
@@ -75,27 +83,55 @@ class KnobController:
 
         self.dev = None
         self.active_cfg = None
+        self.cached_fd = None
 
-        if self.display:
-            self.display.set_knob(False)
+        self.display.set_knob(False)
 
         self.logger.log("VFO-Knob disconnected", "INFO")
 
     def fd(self):
-        """Return file descriptor."""
-        return self.dev.fd if self.dev else None
+        """Return the file descriptor cached at connect time."""
+        return self.cached_fd if self.dev else None
+
+    def _build_code_map(self):
+        """Cache the key-code dispatch table for the active config."""
+        cfg = self.active_cfg
+        self._code_map = {
+            cfg.key_up:   self._knob_up,
+            cfg.key_down: self._knob_down,
+            cfg.key_step: self._knob_step,
+        }
+        self._map_cfg = cfg
+
+    def _knob_up(self, sync, step):
+        sync.nudge(step.get_step())                    # step size unchanged here, no display refresh
+        self.display.set_knob_input("UP ")
+
+    def _knob_down(self, sync, step):
+        sync.nudge(-step.get_step())
+        self.display.set_knob_input("DWN")
+
+    def _knob_step(self, sync, step):
+        step.next_step()
+        self.display.set_step_value(step.get_step())
+        self.display.set_knob_input("STP")
 
     def handle_events(self, sync, step):
         """Drain pending knob events and dispatch mapped actions."""
         if not self.dev or not self.active_cfg:
             return False
 
+        if self._map_cfg is not self.active_cfg:
+            self._build_code_map()
+        code_map = self._code_map
+
         had_action = False
 
         try:
-            for _ in range(32):
+            read = self.dev.read                                                       # drain everything queued this
+            while True:                                                                # tick; nothing carries over
                 try:
-                    events = list(self.dev.read())
+                    events = list(read())
                 except BlockingIOError:
                     break
 
@@ -103,37 +139,12 @@ class KnobController:
                     break
 
                 for event in events:
-                    if event.type == ecodes.EV_SYN:
-                        continue
-
-                    if event.type != ecodes.EV_KEY:
-                        continue
-
-                    if event.value != 1:
-                        continue
-
-                    if event.code == self.active_cfg.key_up:
-                        sync.nudge(step.get_step())
-                        if self.display:
-                            self.display.set_step_value(step.get_step())
-                            self.display.set_knob_input("UP ")
-
-                        had_action = True
-
-                    elif event.code == self.active_cfg.key_down:
-                        sync.nudge(-step.get_step())
-                        if self.display:
-                            self.display.set_step_value(step.get_step())
-                            self.display.set_knob_input("DWN")
-
-                        had_action = True
-
-                    elif event.code == self.active_cfg.key_step:
-                        step.next_step()
-                        if self.display:
-                            self.display.set_step_value(step.get_step())
-                            self.display.set_knob_input("STP")
+                    if event.value != 1 or event.type != _EV_KEY:                      # skip key-up/autorepeat on the
+                        continue                                                       # cheap value check first
 
+                    handler = code_map.get(event.code)
+                    if handler is not None:
+                        handler(sync, step)
                         had_action = True
 
             return had_action
@@ -159,16 +170,63 @@ class KnobController:
             return True
 
     def _find_input_device(self):
-        """Iterate through all knob configs and return the first matching grabbed device."""
+        """Open each input device once and grab the first that matches any knob config."""
+        by_key = {}                                                                    # identity -> config index
         for knob_cfg in self.cfg.knobs:
-            dev = self._probe_device(knob_cfg, self.logger)
-            if dev:
-                self.active_cfg = knob_cfg
-                return dev
+            key = (knob_cfg.target_name, knob_cfg.target_vendor, knob_cfg.target_product)
+            by_key.setdefault(key, knob_cfg)
+
+        for path in list_devices():
+            dev = None
+            keep = False
+
+            try:
+                dev = InputDevice(path)
+                knob_cfg = by_key.get((dev.name, dev.info.vendor, dev.info.product))
+                if knob_cfg is None:
+                    continue
+
+                keep = self._grab_if_capable(dev, knob_cfg, self.logger)
+                if keep:
+                    self.active_cfg = knob_cfg
+                    return dev
+
+            except OSError as e:
+                self.logger.log(f"Error accessing KNOB {path}: {e}", "WARN")
+
+            finally:
+                if dev is not None and not keep:
+                    try:
+                        dev.close()
+                    except OSError:
+                        pass
 
         self.logger.log("No matching knob device found.", "DEBUG")
         return None
 
+    @classmethod
+    def _grab_if_capable(cls, dev, knob_cfg, logger):
+        """Capability-check and grab an identity-matched device. True when grabbed."""
+        caps = dev.capabilities().get(ecodes.EV_KEY, [])                               # the expensive ioctl, only run
+        if knob_cfg.key_up not in caps or knob_cfg.key_down not in caps:               # after the identity match
+            logger.log(
+                f"Device {dev.name} ignored (missing key_up/down capabilities)",
+                "DEBUG",
+            )
+            return False
+
+        try:
+            dev.grab()
+        except OSError as e:
+            if getattr(e, "errno", None) == errno.EBUSY:
+                logger.log(f"Failed to grab knob {dev.path}: device busy", "DEBUG")
+            else:
+                logger.log(f"Failed to grab knob {dev.path}: {e}", "WARN")
+            return False
+
+        logger.log(f"VFO-Knob found: {dev.name}", "DEBUG")
+        return True
+
     @classmethod
     def _probe_device(cls, knob_cfg, logger):
         """Scan for devices and return matching grabbed VFO InputDevice or None."""
@@ -188,26 +246,9 @@ class KnobController:
                 if not matched:
                     continue
 
-                caps = dev.capabilities().get(ecodes.EV_KEY, [])
-                if knob_cfg.key_up not in caps or knob_cfg.key_down not in caps:
-                    logger.log(
-                        f"Device {dev.name} ignored (missing key_up/down capabilities)",
-                        "DEBUG",
-                    )
-                    continue
-
-                try:
-                    dev.grab()
-                except OSError as e:
-                    if getattr(e, "errno", None) == errno.EBUSY:
-                        logger.log(f"Failed to grab knob {path}: device busy", "DEBUG")
-                    else:
-                        logger.log(f"Failed to grab knob {path}: {e}", "WARN")
-                    continue
-
-                logger.log(f"VFO-Knob found: {dev.name}", "DEBUG")
-                keep = True
-                return dev
+                keep = cls._grab_if_capable(dev, knob_cfg, logger)
+                if keep:
+                    return dev
 
             except OSError as e:
                 logger.log(f"Error accessing KNOB {path}: {e}", "WARN")
@@ -6,6 +6,15 @@ Uses python logging to write to display. Optional file logging.
 import sys
 import logging
 
+_LEVEL_NO = {                                                                     # precomputed level numbers: log()
+    'DEBUG': logging.DEBUG,                                                       # runs per message, getattr+upper
+    'INFO': logging.INFO,                                                         # per call adds up
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
 class DisplayLogHandler(logging.Handler):
     """Custom logging handler that sends log messages to a display object."""
 
@@ -58,13 +67,23 @@ class Logger:
 
     def is_enabled(self, level='INFO'):
         """Return True if a level would currently be logged."""
-        return self.logger.isEnabledFor(
-            getattr(logging, str(level).upper(), logging.INFO)
-        )
+        levelno = _LEVEL_NO.get(level)
+        if levelno is None:
+            levelno = getattr(logging, str(level).upper(), logging.INFO)
+        return self.logger.isEnabledFor(levelno)
 
     def log(self, msg, level='INFO'):
         """Log a message at a given level."""
-        self.logger.log(getattr(logging, level.upper(), logging.INFO), msg)
+        levelno = _LEVEL_NO.get(level)
+        if levelno is None:                                                       # odd casing falls back to getattr
+            levelno = getattr(logging, str(level).upper(), logging.INFO)
+        self.logger.log(levelno, msg)
+
+    def debug(self, build_msg):
+        """Log a DEBUG message built lazily: build_msg is only called when
+        DEBUG is active, so hot paths skip the string formatting."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.log(logging.DEBUG, build_msg())
 
     def close(self):
         """Close all handlers."""
@@ -5,6 +5,7 @@ Supports Direct Mode (Bidirectional) or iFreq Mode (one-way, with offset)
 Keyboard, Mouse or External VFO-Knob can be used to change frequency
 """
 
+import os
 import time
 import argparse
 from argparse import RawTextHelpFormatter
@@ -19,6 +20,7 @@ from pansyncer.step import StepController
 from pansyncer.display import Display
 from pansyncer.sync import SyncManager
 from pansyncer.logger import Logger
+from pansyncer.utils import NULL_DISPLAY
 
 VERSION = "0.6.6"
 
@@ -48,7 +50,7 @@ class PanSyncer:
                 sys.exit(1)
 
             if self.cfg.main.daemon:                                                        # Display setup
-                self.display = None
+                self.display = NULL_DISPLAY                                                 # falsy no-op stand-in
             else:
                 self.display = Display(self.cfg,
                                        self.devices,
@@ -134,8 +136,7 @@ class PanSyncer:
                     logger.log(f"sync shutdown error: {e}", "ERROR")
         if is_tty:
             try:
-                sys.stdout.write("\033[?1004l\033[?2004l")                                  # disable focus and paste
-                sys.stdout.flush()
+                os.write(sys.stdout.fileno(), b"\033[?1004l\033[?2004l")                    # disable focus and paste
             except Exception:
                 pass
             if old_term is not None:
@@ -163,8 +164,8 @@ class PanSyncer:
             fd = sys.stdin.fileno()
             self.old_term = termios.tcgetattr(fd)
             tty.setcbreak(fd)
-            sys.stdout.write("\033[?1004h\033[?2004h") # enable focus events and bracketed paste
-            sys.stdout.flush()
+            os.write(sys.stdout.fileno(), b"\033[?1004h\033[?2004h")   # enable focus events and bracketed paste,
+                                                                       # unbuffered so no flush needed
         else:
             self.cfg.main.daemon= True
 
@@ -5,15 +5,27 @@ Probes for mice, polls their FDs to change frequency and step cycles.
 
 import os
 import time
+from array import array
 
 import evdev
 
+from pansyncer.utils import NULL_DISPLAY
+
+_EV_SYN = evdev.ecodes.EV_SYN                          # hoisted: one global load per event instead of
+_EV_REL = evdev.ecodes.EV_REL                          # three attribute lookups through evdev.ecodes
+_REL_WHEEL = evdev.ecodes.REL_WHEEL
+_EV_KEY = evdev.ecodes.EV_KEY
+_BTN_MIDDLE = evdev.ecodes.BTN_MIDDLE
+
 
 class MouseState:
     """Discovery and event handling for mouse - reads all available mice."""
 
+    _by_fd = None                                      # fd -> device cache, None = stale, rebuilt on demand
+    _fds = array('i')                                  # typed fd array handed to the poll loop as-is
+
     def __init__(self, now, logger, display=None, fullscan_interval=9.0):
-        self.display = display
+        self.display = display if display is not None else NULL_DISPLAY
         self.logger = logger
         self.mice = []
         self.last_scroll_time = now
@@ -21,6 +33,11 @@ class MouseState:
         self._fullscan_interval = max(0.0, float(fullscan_interval))
         self._discover_devices(now=now)
 
+    def _rebuild_fd_cache(self):
+        """Rebuild the fd lookup map and poll array from the mouse list."""
+        self._by_fd = {dev.fd: dev for dev in self.mice}
+        self._fds = array('i', self._by_fd)            # scales past the dict for many-HID setups
+
     def _close_device(self, dev):
         """Close an evdev device, ignoring close errors."""
         try:
@@ -49,8 +66,8 @@ class MouseState:
 
         if changed:
             self.mice = found
-            if self.display:
-                self.display.set_mouse(bool(self.mice))
+            self._by_fd = None
+            self.display.set_mouse(bool(self.mice))
 
         return bool(self.mice)
 
@@ -96,12 +113,12 @@ class MouseState:
                 caps = dev.capabilities()
 
                 has_wheel = (
-                    evdev.ecodes.EV_REL in caps
-                    and evdev.ecodes.REL_WHEEL in caps[evdev.ecodes.EV_REL]
+                    _EV_REL in caps
+                    and _REL_WHEEL in caps[_EV_REL]
                 )
                 has_click = (
-                    evdev.ecodes.EV_KEY in caps
-                    and evdev.ecodes.BTN_MIDDLE in caps[evdev.ecodes.EV_KEY]
+                    _EV_KEY in caps
+                    and _BTN_MIDDLE in caps[_EV_KEY]
                 )
 
                 if has_wheel or has_click:
@@ -116,10 +133,10 @@ class MouseState:
                     self._close_device(dev)
 
         self.mice = found
+        self._by_fd = None
         self._last_discovery = now
 
-        if self.display:
-            self.display.set_mouse(bool(self.mice))
+        self.display.set_mouse(bool(self.mice))
 
     def ensure_connected(self, force=False, now=None):
         """Return True if at least one mouse is tracked, rescanning only when needed."""
@@ -152,9 +169,9 @@ class MouseState:
                 self.logger.log(f"Failed to close mouse device {e}", "WARN")
 
         self.mice.clear()
+        self._by_fd = None
 
-        if self.display:
-            self.display.set_mouse(False)
+        self.display.set_mouse(False)
 
         self.logger.log("Mouse disabled", "INFO")
 
@@ -177,24 +194,34 @@ class MouseState:
 
 
     def get_fds(self):
-        """Return a list of file descriptors to poll."""
-        return [dev.fd for dev in self.mice]
+        """Return the file descriptors to poll."""
+        if self._by_fd is None:
+            self._rebuild_fd_cache()
+        return self._fds
 
 
+    def _flush_wheel(self, delta, sync, step):
+        """Send the accumulated wheel delta as a single nudge."""
+        sync.nudge(delta * step.get_step())
+        self.display.set_mouse_input("UP " if delta > 0 else "DWN")
+
     def handle_event(self, fd, sync, step, now, active=True):
         """Drain pending mouse events for the given fd and dispatch relevant actions when active."""
-        dev = next((d for d in self.mice if d.fd == fd), None)
+        if self._by_fd is None:
+            self._rebuild_fd_cache()
+        dev = self._by_fd.get(fd)
         if not dev:
             return False
 
         had_action = False
+        delta = 0                                                           # wheel clicks coalesced per drain
 
         try:
             for event in dev.read():
-                if event.type == evdev.ecodes.EV_SYN:
+                if event.type == _EV_SYN:
                     continue
 
-                if event.type == evdev.ecodes.EV_REL and event.code == evdev.ecodes.REL_WHEEL:
+                if event.type == _EV_REL and event.code == _REL_WHEEL:
                     if event.value == 0:
                         continue
 
@@ -202,32 +229,30 @@ class MouseState:
                         continue
 
                     self.last_scroll_time = now
-                    if event.value > 0:
-                        sync.nudge(step.get_step())
-                        if self.display:
-                            self.display.set_mouse_input("UP ")
-                    else:
-                        sync.nudge(-step.get_step())
-                        if self.display:
-                            self.display.set_mouse_input("DWN")
-
+                    delta += 1 if event.value > 0 else -1
                     had_action = True
 
                 elif (
-                    event.type == evdev.ecodes.EV_KEY
-                    and event.code == evdev.ecodes.BTN_MIDDLE
+                    event.type == _EV_KEY
+                    and event.code == _BTN_MIDDLE
                     and event.value == 1
                 ):
                     if not active:
                         continue
 
+                    if delta:                                               # flush at the old step size before
+                        self._flush_wheel(delta, sync, step)                # the click changes it
+                        delta = 0
+
                     step.next_step()
-                    if self.display:
-                        self.display.set_step_value(step.get_step())
-                        self.display.set_mouse_input("STP")
+                    self.display.set_step_value(step.get_step())
+                    self.display.set_mouse_input("STP")
 
                     had_action = True
 
+            if delta:                                                       # one nudge + one display update
+                self._flush_wheel(delta, sync, step)                        # per burst instead of per event
+
             return had_action
 
         except OSError as e:
@@ -238,7 +263,7 @@ class MouseState:
                 pass
             if dev in self.mice:
                 self.mice.remove(dev)
-            if self.display:
-                self.display.set_mouse(bool(self.mice))
+            self._by_fd = None
+            self.display.set_mouse(bool(self.mice))
             self.logger.log(f"Mouse disconnected: {dev.name}", "INFO")
             return False
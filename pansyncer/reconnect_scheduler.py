@@ -6,12 +6,20 @@ Main loop (device ) drains a thread-safe result queue each tick to apply timing/
 
 import time
 import random
+import heapq
+import itertools
 from dataclasses import dataclass
+from collections import deque, defaultdict
 import concurrent.futures
-from queue import Queue, Empty
 
 __all__ = ["SchedulerConfig", "ReconnectScheduler", "TaskRecord"]
 
+class _ResultDeque(deque):
+    """Single-consumer result channel. append/popleft are atomic under the
+    GIL, so no Condition/Lock round-trip per result like queue.Queue. put()
+    stays as an alias for callers that enqueue results directly."""
+    put = deque.append
+
 @dataclass
 class SchedulerConfig:
     """Default configuration"""
@@ -21,12 +29,27 @@ class SchedulerConfig:
     backoff_cap: float      = 4.0
     jitter: float           = 0.10
     slow_threshold: float   = 1.0
+    adaptive_cap: float     = 8.0
 
-@dataclass                                                                                       ##### Data structure
+                                                                                                 ##### Data structure
 class TaskRecord:
+    __slots__ = ('fn', 'tag', 'next_run', 'interval', 'base_interval', 'backoff',                # no per-record dict;
+                 'failures', 'future', 'generation', 'last_duration', 'running',                 # slot loads in the
+                 'pending_result', 'backoff_cap', 'backoff_table', 'stable_successes')           # drain loop are C-level
+
     def __init__(self, fn=None, tag='', next_run=0.0, interval=0.0, base_interval=0.0,
                  backoff=True, failures=0, future=None, generation=0, last_duration=0.0,
-                 pending_result=None, backoff_cap=None):
+                 pending_result=None, backoff_cap=None, backoff_table=None):
+        self.reset(fn=fn, tag=tag, next_run=next_run, interval=interval,
+                   base_interval=base_interval, backoff=backoff, failures=failures,
+                   future=future, generation=generation, last_duration=last_duration,
+                   pending_result=pending_result, backoff_cap=backoff_cap,
+                   backoff_table=backoff_table)
+
+    def reset(self, fn=None, tag='', next_run=0.0, interval=0.0, base_interval=0.0,
+              backoff=True, failures=0, future=None, generation=0, last_duration=0.0,
+              pending_result=None, backoff_cap=None, backoff_table=None):
+        """(Re)initialize all fields, so pooled records can be reused in place."""
         self.fn = fn
         self.tag = tag
         self.next_run = next_run
@@ -35,13 +58,21 @@ class TaskRecord:
         self.backoff = backoff
         self.failures = failures
         self.future = future
+        self.running = future is not None and not future.done()
         self.generation = generation
         self.last_duration = last_duration
         self.pending_result = pending_result
         self.backoff_cap = backoff_cap
+        self.backoff_table = backoff_table
+        self.stable_successes = 0
                                                                                        ##### Scheduler
 class ReconnectScheduler:
     """ Schedule worker threads for periodic connection checks"""
+
+    _MAX_RESULTS_PER_TICK = 64                                                 # bounds drain time per main-loop tick
+    _STABLE_BEFORE_STRETCH = 3                                                 # successes before the probe cadence
+                                                                               # starts stretching toward adaptive_cap
+
     def __init__(self, cfg, logger):
         self.cfg = cfg
         self.logger = logger
@@ -50,22 +81,45 @@ class ReconnectScheduler:
         self.backoff_cap = self.cfg.reconnect_scheduler.backoff_cap
         self.jitter = self.cfg.reconnect_scheduler.jitter
         self.slow_threshold = self.cfg.reconnect_scheduler.slow_threshold
+        self.adaptive_cap = getattr(self.cfg.reconnect_scheduler, 'adaptive_cap', 8.0)
         self.executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=self.cfg.reconnect_scheduler.max_workers
         )
         self.tasks = {}
-        self.generation = 0
-        self._result_queue = Queue()
+        self._tag_to_fns = defaultdict(set)                                    # tag -> registered fns, spares the
+        self._rec_pool = []                                                    # retired records, reset-in-place on
+        self.generation = 0                                                    # re-register instead of reallocating
+        self._result_queue = _ResultDeque()
         self._shutdown = False
         self._next_due = float("inf")
+        self._heap = []                                                        # (next_run, seq, rec) due-time heap
+        self._heap_counter = itertools.count()                                 # seq breaks ties, recs never compared
 
-    def _recompute_next_due(self):
-        """Cache the earliest next_run time across all tasks."""
-        if not self.tasks:
-            self._next_due = float("inf")
-            return
+    @staticmethod
+    def _build_backoff_table(base, cap):
+        """Precompute the capped (lo, hi) jitter bands per failure count, so
+        the drain loop indexes a list instead of raising 2 to a power."""
+        if base <= 0:
+            return [(0.0, 0.0)]
+        table = []
+        failures = 1
+        while True:
+            lo = min(cap, base * (1 << (failures - 1)))
+            hi = min(cap, base * (1 << failures))
+            table.append((lo, hi))
+            if lo >= cap:                                                      # band fully saturated, later
+                return table                                                   # failures reuse the last entry
+            failures += 1
 
-        self._next_due = min(rec.next_run for rec in self.tasks.values())
+    def _recompute_next_due(self):
+        """Rebuild the due-time heap from the task table and cache the head.
+        Called whenever next_run values change outside tick(); stale heap
+        entries from before the rebuild are skipped lazily when popped."""
+        counter = self._heap_counter
+        self._heap = [(rec.next_run, next(counter), rec)
+                      for rec in self.tasks.values()]
+        heapq.heapify(self._heap)
+        self._next_due = self._heap[0][0] if self._heap else float("inf")
                                                                                            ##### Registration / Removal
     def register(self, fn, tag = None, backoff = True, run_immediately = True,
                  interval = None, backoff_cap = None):
@@ -84,10 +138,16 @@ class ReconnectScheduler:
         first = now if run_immediately else now + actual_interval
         rec = self.tasks.get(fn)
         if rec:
+            if rec.tag != tag:
+                self._tag_to_fns[rec.tag].discard(fn)
+                if not self._tag_to_fns[rec.tag]:
+                    del self._tag_to_fns[rec.tag]
+            self._tag_to_fns[tag].add(fn)
             rec.tag = tag
             rec.backoff = backoff
             rec.base_interval = actual_interval
             rec.backoff_cap = actual_backoff_cap
+            rec.backoff_table = self._build_backoff_table(actual_interval, actual_backoff_cap)
             if rec.interval < actual_interval:
                 rec.interval = actual_interval
             if run_immediately:
@@ -95,7 +155,8 @@ class ReconnectScheduler:
             self._recompute_next_due()
             return
 
-        self.tasks[fn] = TaskRecord(
+        rec = self._rec_pool.pop() if self._rec_pool else TaskRecord()
+        rec.reset(
             fn=fn,
             tag=tag,
             next_run=first,
@@ -104,7 +165,10 @@ class ReconnectScheduler:
             backoff=backoff,
             generation=self.generation,
             backoff_cap=actual_backoff_cap,
+            backoff_table=self._build_backoff_table(actual_interval, actual_backoff_cap),
         )
+        self.tasks[fn] = rec
+        self._tag_to_fns[tag].add(fn)
         self._recompute_next_due()
         self.logger.log(
             f"Scheduler: registered task tag:{tag} interval:{actual_interval} generation:{self.generation}", "DEBUG")
@@ -137,19 +201,36 @@ class ReconnectScheduler:
 
     def unregister_tag(self, tag):
         self.generation += 1
-        to_remove = [fn for fn, rec in self.tasks.items()
-                     if rec.tag == tag or rec.tag.startswith(tag)]
+        matched_tags = [key for key in self._tag_to_fns
+                        if key == tag or key.startswith(tag)]
+        to_remove = [fn for key in matched_tags for fn in self._tag_to_fns[key]]
+        for key in matched_tags:
+            del self._tag_to_fns[key]
         for fn in to_remove:
-            self.tasks.pop(fn, None)
+            rec = self.tasks.pop(fn, None)
+            if rec is not None and len(self._rec_pool) < 8:
+                rec.reset()                                                    # drop fn/future refs while pooled
+                self._rec_pool.append(rec)
         self._recompute_next_due()
         self.logger.log("Scheduler: unregistered %d task(s) for tag '%s'" % (len(to_remove), tag), "DEBUG")
 
                                                                                            ##### Main Loop Tick
+    def due(self, now=None):
+        """Return True when tick() has work: a finished result to drain or a
+        task whose next_run has passed. Lets the caller skip tick() cheaply."""
+        if self._shutdown:
+            return False
+        if self._result_queue:
+            return True
+        if now is None:
+            now = time.monotonic()
+        return now >= self._next_due
+
     def tick(self):
         if self._shutdown:
             return
 
-        results_pending = not self._result_queue.empty()
+        results_pending = bool(self._result_queue)
         now = time.monotonic()
 
         if not results_pending and now < self._next_due:
@@ -162,19 +243,38 @@ class ReconnectScheduler:
             if now < self._next_due:
                 return
 
-        changed = False
+        heap = self._heap
+        counter = self._heap_counter
+        submit = self.executor.submit
+        busy = []                                                              # still-running tasks keep their slot
 
-        for rec in list(self.tasks.values()):
-            if now >= rec.next_run:
-                if rec.future is None or rec.future.done():
-                    rec.next_run = now + rec.interval
-                    rec.future = self.executor.submit(self._worker_wrapper, rec.fn, rec.generation)
-                    changed = True
+        while heap and heap[0][0] <= now:                                      # only the due head is inspected,
+            when, _, rec = heapq.heappop(heap)                                 # idle tasks are never touched
+            if self.tasks.get(rec.fn) is not rec:
+                continue                                                       # tombstoned entry
+            if rec.next_run != when:                                           # rescheduled since queued: requeue
+                heapq.heappush(heap, (rec.next_run, next(counter), rec))       # at the record's real due time
+                continue
+            if not rec.running:                                                # plain bool read; no Future
+                rec.next_run = now + rec.interval                              # condition lock per check
+                rec.future = submit(self._worker_wrapper, rec.fn, rec.generation)
+                rec.running = True
+                heapq.heappush(heap, (rec.next_run, next(counter), rec))
+            else:
+                busy.append((when, next(counter), rec))
 
-        if changed:
-            self._recompute_next_due()
+        for entry in busy:
+            heapq.heappush(heap, entry)
+
+        self._next_due = heap[0][0] if heap else float("inf")
 
                                                                                            ##### Worker and result
+    def _debug_enabled(self):
+        """True when DEBUG messages would be emitted, so hot paths can skip
+        building them. Loggers without level filtering always get them."""
+        is_enabled = getattr(self.logger, 'is_enabled', None)
+        return is_enabled('DEBUG') if is_enabled else True
+
     def _worker_wrapper(self, fn, generation):
         start = time.monotonic()
         success = True
@@ -184,49 +284,69 @@ class ReconnectScheduler:
                 success = False
         except (OSError, IOError, ValueError, RuntimeError) as e:
             success = False
-            self.logger.log("%s error: %s" % (fn.__name__, e), "DEBUG")
+            if self._debug_enabled():
+                self.logger.log("%s error: %s" % (fn.__name__, e), "DEBUG")
         except Exception as e:
             success = False
             self.logger.log("%s unexpected %s: %s" % (fn.__name__, e.__class__.__name__, e), "ERROR")
         finally:
             duration = time.monotonic() - start
-            self._result_queue.put((fn, success, duration, generation))                    # Enqueue
+            self._result_queue.append((fn, success, duration, generation))                 # Enqueue
         return True
 
     def _drain_results(self):
         now = time.monotonic()
-        while True:
-            try:
-                fn, success, duration, generation = self._result_queue.get_nowait()
-            except Empty:
-                break
-            rec = self.tasks.get(fn)
+        batch = self._result_queue                                             # drained in place: popleft on the
+        processed = 0                                                          # shared deque is safe with a single
+                                                                               # consumer, and worker appends land
+                                                                               # behind the results being drained
+        tasks_get = self.tasks.get                                             # hot locals: one lookup per drain
+        log = self.logger.log                                                  # instead of per result
+        uniform = random.uniform
+        slow_threshold = self.slow_threshold
+        debug_on = self._debug_enabled()                                       # skip %-formatting when DEBUG is off
+        slow = []                                                              # summarized in one record per drain
+        while batch and processed < self._MAX_RESULTS_PER_TICK:                # leftovers stay queued for the
+            fn, success, duration, generation = batch.popleft()                # next drain
+            processed += 1
+            rec = tasks_get(fn)
             if not rec:
                 continue
             if generation != rec.generation:
                 continue
             rec.last_duration = duration
-            if duration > self.slow_threshold:
-                self.logger.log("%s slow %.1fms" % (fn.__name__, duration * 1000.0), "DEBUG")
+            if duration > slow_threshold and debug_on:
+                slow.append("%s %.1fms" % (fn.__name__, duration * 1000.0))
 
             if rec.backoff:
+                cap = rec.backoff_cap if rec.backoff_cap is not None else self.backoff_cap
                 if success:
                     rec.failures = 0
-                    rec.interval = rec.base_interval
+                    rec.stable_successes += 1
+                    if rec.stable_successes > self._STABLE_BEFORE_STRETCH:
+                        rec.interval = min(rec.interval * 1.25,                # stable rig: probe less often,
+                                           max(self.adaptive_cap,             # any failure snaps back to base;
+                                               rec.base_interval))             # never below the configured base
+                    else:
+                        rec.interval = uniform(                                # jittered reset keeps recovered
+                            rec.base_interval,                                 # tasks from re-aligning
+                            min(rec.base_interval * (1.0 + self.jitter), cap),
+                        )
                 else:
                     rec.failures += 1
-                    cap = rec.backoff_cap if rec.backoff_cap is not None else self.backoff_cap
-                    rec.interval = min(
-                        rec.base_interval + (self.backoff_step * rec.failures),
-                        cap
-                    )
-                rec.interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
-                cap = rec.backoff_cap if rec.backoff_cap is not None else self.backoff_cap
-                rec.interval = min(rec.interval, cap)
+                    rec.stable_successes = 0
+                    table = rec.backoff_table
+                    lo, hi = table[min(rec.failures, len(table)) - 1]
+                    rec.interval = uniform(lo, hi)                             # ranged jitter spreads retries so
+                                                                               # reconnects do not storm rigctld
             target = now + rec.interval
             if rec.next_run < target:
                 rec.next_run = target
             rec.future = None
+            rec.running = False
+
+        if slow:
+            log("slow: " + ", ".join(slow), "DEBUG")
 
         self._recompute_next_due()
                                                                                            ##### Diagnostics
@@ -235,7 +355,7 @@ class ReconnectScheduler:
         lines = []
         for rec in self.tasks.values():
             eta = rec.next_run - now
-            running = rec.future is not None and not rec.future.done()
+            running = rec.running
             lines.append("%s tag=%s run_in=%6.2fs int=%5.2fs fail=%d run=%s dur=%6.1fms" % (
                 rec.fn.__name__, rec.tag, eta, rec.interval, rec.failures,
                 'Y' if running else 'N', rec.last_duration * 1000.0))
@@ -5,10 +5,10 @@ Launches and monitors rigctld
 
 import subprocess
 import socket
+import selectors
 import threading
 import os
 import signal
-import re
 import shlex
 from dataclasses import dataclass
 from typing import Optional
@@ -25,6 +25,8 @@ class RigCheckConfig:
 class RigChecker:
     """ Starts rigctld if requested, checks Rig connectivity. """
 
+    _PROBE = b'f\n'                                                                     # pre-encoded freq request
+
     def __init__(self, cfg, port=None, display=None, auto_start=True):
         self.cfg = cfg
         self.port = port if port is not None else self.cfg.sync.rig_port
@@ -32,6 +34,11 @@ class RigChecker:
         self.auto_start = auto_start
         self._proc = None
         self._sock = None
+        self._launch_cmd = None                                                         # resolved rigctld command,
+        self._selector = None
+        self._pending = False
+        self._rxbuf = bytearray(1024)                                                   # reused probe reply buffer,
+        self._rxview = memoryview(self._rxbuf)                                          # no allocation per recv
         self.rig_freq = None
         self.logger = Logger(name=__name__,
                              display=self.display,
@@ -55,28 +62,45 @@ class RigChecker:
             if self.display: self.display.set_rig_con(False)
             return False
 
+        if self._pending:                                                               # discard a reply that arrived
+            self._drain_stale()                                                         # after the previous probe
+            if not self._sock:                                                          # timed out
+                return False
+
         try:                                                                            # Request RIG FREQ
-            self._sock.sendall(b'f\n')
+            self._sock.sendall(self._PROBE)
             self.logger.log("RIGCHECK SENT FREQ REQUEST", "DEBUG")
         except (BrokenPipeError, ConnectionResetError, socket.error) as e:
             self.logger.log(f"RIGCHECK socket send failed: {e}", "WARNING")
             self._reset_socket()
             return False
 
+        if self._selector is not None:                                                  # bounded readiness wait; a
+            if not self._selector.select(timeout=0.1):                                  # slow reply frees the worker
+                self._pending = True                                                    # instead of blocking it
+                self.logger.log("RIGCHECK reply pending", "DEBUG")
+                return False
+
         try:                                                                            # Read socket
-            data = self._sock.recv(1024)
+            if self._selector is not None:
+                buf = self._rxbuf                                                       # recv into the reused buffer
+                n = self._sock.recv_into(self._rxview)
+            else:
+                buf = self._sock.recv(1024)
+                n = len(buf)
         except OSError as e:
             self.logger.log(f"RIGCHECK RECV ERROR {e}", "DEBUG")
             self._reset_socket()
             return False
-        if not data:
+        if not n:
             self.logger.log("RIGCHECK SOCKET DIED", "WARNING")
             self._reset_socket()
             return False
 
-        self.logger.log(f"RIGCHECK RECEIVED: {data}", "DEBUG")
+        self.logger.log(f"RIGCHECK RECEIVED: {bytes(buf[:n])}", "DEBUG")
 
-        reply = data.partition(b'\n')[0].decode().strip()
+        end = buf.find(b'\n', 0, n)
+        reply = buf[:end if end != -1 else n].decode().strip()
         try:
             freq = int(reply)
             self.rig_freq = freq
@@ -102,8 +126,7 @@ class RigChecker:
         self.logger.log(f"Launching rigctld on port {self.port}", "INFO")
 
         try:
-            cmd = shlex.split(self.cfg.rigcheck.hamlib_command)                         # Hamlib command
-            cmd = self._set_rigctld_port(cmd, self.port)                                # use actual rig port
+            cmd = self._launch_command()                                                # split and port-patched once
         except ValueError as e:
             self.logger.log(f"Invalid rigctld command: {e}", "ERROR")
             self._proc = None
@@ -129,6 +152,13 @@ class RigChecker:
 
         return True
 
+    def _launch_command(self):
+        """Resolve the rigctld launch command once and reuse it for relaunches."""
+        if self._launch_cmd is None:
+            cmd = shlex.split(self.cfg.rigcheck.hamlib_command)                         # Hamlib command
+            self._launch_cmd = self._set_rigctld_port(cmd, self.port)                   # use actual rig port
+        return self._launch_cmd
+
     def _is_port_open(self):
         """ Return True if rigctld is listening on the configured port. """
         try:
@@ -156,19 +186,51 @@ class RigChecker:
                 pass
 
     def _ensure_socket(self):
-        """ Open a socket to rigctld to query rig is alive"""
+        """ Open a non-blocking socket to rigctld to query rig is alive"""
         if self._sock is None:
             try:
                 self._sock = socket.create_connection((self.cfg.rigcheck.hamlib_remote_ip, self.port), timeout=2)
-                self._sock.settimeout(0.5)
+                self._sock.setblocking(False)                                           # readiness comes from the
+                self._selector = selectors.DefaultSelector()                            # selector, recv never blocks
+                self._selector.register(self._sock, selectors.EVENT_READ)
+                self._pending = False
             except Exception as e:
                 self.logger.log(f"Could not open rigctld socket: {e}", "DEBUG")
+                self._close_selector()
                 self._sock = None
 
+    def _drain_stale(self):
+        """Throw away a late reply from a probe that already timed out."""
+        self._pending = False
+        while True:
+            try:
+                n = self._sock.recv_into(self._rxview)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self.logger.log(f"RIGCHECK RECV ERROR {e}", "DEBUG")
+                self._reset_socket()
+                return
+            if not n:
+                self.logger.log("RIGCHECK SOCKET DIED", "WARNING")
+                self._reset_socket()
+                return
+
+    def _close_selector(self):
+        """Close the readiness selector, if any."""
+        if self._selector is not None:
+            try:
+                self._selector.close()
+            except OSError:
+                pass
+            self._selector = None
+        self._pending = False
+
     def _reset_socket(self):
         """Close the socket."""
         self.rig_freq = None
         if self.display: self.display.set_rig_con(False)
+        self._close_selector()
         if self._sock is None:
             return
         try:
@@ -201,6 +263,7 @@ class RigChecker:
 
     def cleanup(self):
         """ Terminate rigctld subprocess and close socket on shutdown. """
+        self._close_selector()
         if self._sock:                                                                  # Close socket
             try:
                 self._sock.close()
@@ -4,18 +4,24 @@ Cycles through a list of tuning increments
 """
 class StepController:
     """ Set the frequency steps, which device inputs will change. """
-    STEPS = [10, 100, 1000, 10000]
+    STEPS = (10, 100, 1000, 10000)                     # power-of-two count, so the cycle is a mask
+
+    _MASK = len(STEPS) - 1
+    assert len(STEPS) & _MASK == 0, "STEPS length must be a power of two"
 
     def __init__(self):
         self.steps = self.STEPS
         self.index = 1  # default = 100 Hz
+        self._current = self.steps[self.index]
 
     def next_step(self):
-        self.index = (self.index + 1) % len(self.steps)
+        self.index = (self.index + 1) & self._MASK
+        self._current = self.steps[self.index]
 
     def get_step(self):
-        return self.steps[self.index]
+        return self._current                           # hottest call: every nudge and redraw
 
     def set_step(self, step):
         if step in self.steps:
             self.index = self.steps.index(step)
+            self._current = step
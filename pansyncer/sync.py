@@ -12,10 +12,13 @@ import socket
 import select
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from pansyncer.logger import Logger
 from pansyncer.bands import Bands
 
+_POLL_ERR_MASK = select.POLLHUP | select.POLLERR | select.POLLNVAL                      # combined once at import
+
 @dataclass
 class SyncConfig:
     """Default configuration"""
@@ -38,12 +41,65 @@ class SyncConfig:
                                                                                         # Sync & buffering
     wait_before_log_rigfreq:    float         = 5.0
     nudge_buffer:               int           = 10
-    read_buffer_size:           int           = 1024
+    read_buffer_size:           int           = 4096
     max_read_buffer_bytes:      int           = 64 * read_buffer_size
 
+
+class _Radio:
+    """Connection and frequency state for one radio. Slot attributes keep
+    hot-path access a C-level read; dict-style item access stays supported
+    for callers that treat the role entry as a mapping."""
+
+    __slots__ = ('role_upper', 'host', 'port', 'sock', 'connected', 'recon_interval',
+                 'recon_timestamp', 'freq_cur', 'freq_processed', 'freq_sent',
+                 'freq_queued', 'freq_queued_is_lo', 'freq_query_interval',
+                 'is_busy', 'send_timestamp', 'timeout', 'poll_mask',
+                 'recv_buf', 'query', 'ev_mask', 'recv_scratch', 'recv_mv',
+                 'query_cmd')
+
+    def __init__(self, name, host, port, recon_interval, freq_query_interval, timeout):
+        self.role_upper = name.upper()                                                  # precomputed for log lines
+        self.host = host
+        self.port = port
+        self.sock = None
+        self.connected = False
+        self.recon_interval = recon_interval
+        self.recon_timestamp = 0.0
+        self.freq_cur = None
+        self.freq_processed = None
+        self.freq_sent = None
+        self.freq_queued = None
+        self.freq_queued_is_lo = False
+        self.freq_query_interval = freq_query_interval
+        self.is_busy = None
+        self.send_timestamp = 0.0
+        self.timeout = timeout
+        self.poll_mask = None
+        self.recv_buf = bytearray()
+        self.query = None
+        self.ev_mask = 0
+        self.recv_scratch = None
+        self.recv_mv = None
+        self.query_cmd = b"f\n"
+
+    def __getitem__(self, key):                                                         # mapping shims: callers outside
+        return getattr(self, key)                                                       # the hot path index by key
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def update(self, values):
+        for key, value in values.items():
+            setattr(self, key, value)
+
 class SyncManager:
     """SyncManager handles synchronization between Rig and Gqrx clients."""
 
+    _UI_REFRESH_INTERVAL = 1 / 30                                                       # cap display updates (seconds)
+
     def __init__(self,
                  cfg,
                  devices,
@@ -60,48 +116,16 @@ class SyncManager:
         self._shutdown = False
 
         self.radio = {
-            'rig': {
-                'host'                        : self.cfg.sync.rig_host,
-                'port'                        : self.cfg.sync.rig_port,
-                'sock'                        : None,
-                'connected'                   : False,
-                'recon_interval'              : self.cfg.sync.rig_socket_recon_interval,
-                'recon_timestamp'             : 0.0,
-                'freq_cur'                    : None,
-                'freq_processed'              : None,
-                'freq_sent'                   : None,
-                'freq_queued'                 : None,
-                'freq_queued_is_lo'           : False,
-                'freq_query_interval'         : self.cfg.sync.rig_freq_query_interval,
-                'is_busy'                     : None,
-                'send_timestamp'              : 0.0,
-                'timeout'                     : self.cfg.sync.rig_timeout,
-                'poll_mask'                   : None,
-                'recv_buf'                    : bytearray(),
-                'query'                       : None,
-                'events'                      : []
-            },
-            'gqrx': {
-                'host'                        : self.cfg.sync.gqrx_host,
-                'port'                        : self.cfg.sync.gqrx_port,
-                'sock'                        : None,
-                'connected'                   : False,
-                'recon_interval'              : self.cfg.sync.gqrx_socket_recon_interval,
-                'recon_timestamp'             : 0.0,
-                'freq_cur'                    : None,
-                'freq_processed'              : None,
-                'freq_sent'                   : None,
-                'freq_queued'                 : None,
-                'freq_queued_is_lo'           : False,
-                'freq_query_interval'         : self.cfg.sync.gqrx_freq_query_interval,
-                'is_busy'                     : None,
-                'send_timestamp'              : 0.0,
-                'timeout'                     : self.cfg.sync.gqrx_timeout,
-                'poll_mask'                   : None,
-                'recv_buf'                    : bytearray(),
-                'query'                       : None,
-                'events'                      : []
-            }
+            'rig':  _Radio('rig', host=self.cfg.sync.rig_host,
+                           port=self.cfg.sync.rig_port,
+                           recon_interval=self.cfg.sync.rig_socket_recon_interval,
+                           freq_query_interval=self.cfg.sync.rig_freq_query_interval,
+                           timeout=self.cfg.sync.rig_timeout),
+            'gqrx': _Radio('gqrx', host=self.cfg.sync.gqrx_host,
+                           port=self.cfg.sync.gqrx_port,
+                           recon_interval=self.cfg.sync.gqrx_socket_recon_interval,
+                           freq_query_interval=self.cfg.sync.gqrx_freq_query_interval,
+                           timeout=self.cfg.sync.gqrx_timeout)
         }
 
         self.sync_on = True  # Sync On/Off
@@ -111,6 +135,7 @@ class SyncManager:
                              display=self.display,
                              level=self.cfg.sync.log_level,
                              logfile_path=self.cfg.sync.logfile_path)
+        self._debug_on = self.logger.is_enabled("DEBUG")                                # Level is fixed after init
                                                                                         # Frequency Logger
         self.log_file = None
         self._last_rig_change = None
@@ -121,11 +146,22 @@ class SyncManager:
             self.logger.log(
                 "[LOG ERROR] Rig not configured, but logfile specified. Turning off logging", "ERROR")
 
+        for rdo in self.radio.values():                                                 # Reusable recv scratch per role
+            rdo.recv_scratch = bytearray(self.cfg.sync.read_buffer_size)
+            rdo.recv_mv = memoryview(rdo.recv_scratch)
+                                                                                        # Static per-role freq queries
+        self.radio['rig'].query_cmd = b"f\n"
+        self.radio['gqrx'].query_cmd = b"LNB_LO\n" if self.ifreq is not None else b"f\n"
+
+        self._role_items = list(self.radio.items())                                     # Stable (role, rdo) pairs for tick
                                                                                         # Poller for non-blocking I/O
         self._poller = select.poll()
         self._fd_map = {}
         self._last_ui_state = None
+        self._last_ui_refresh = 0.0
+        self._ui_setters = None
         self._last_band_freq_hz = object()
+        self._last_band_name = None
 
     # # # # # # # # #
     # # #  API  # # #
@@ -136,52 +172,53 @@ class SyncManager:
         if self._shutdown:                                                              # Return on shutdown
             return
 
-        events = self._poller.poll(0)                                                   # Poll all sockets
-        for rdo in self.radio.values():                                                 # Clear old events
-            rdo['events'] = []
+        role_items = self._role_items                                                   # Hot locals for the tick loop
+        radio = self.radio
+        fd_map_get = self._fd_map.get
+        pollin = select.POLLIN
+        enabled = self.devices.enabled
+
+        events = self._poller.poll(0) if self._fd_map else ()                           # Poll, skip syscall if no FDs
+        for _, rdo in role_items:                                                       # Clear old events
+            rdo.ev_mask = 0
 
-        for fd, flag in events:                                                         # Assign new events to radio{}
-            role = self._fd_map.get(fd)
+        for fd, flag in events:                                                         # Combine new events per role
+            role = fd_map_get(fd)
             if role:
-                self.radio[role]['events'].append((fd, flag))
+                radio[role].ev_mask |= flag
 
-        for role, rdo in self.radio.items():                                            ##### Read / reconnect loop
+        for role, rdo in role_items:                                                    ##### Read / reconnect loop
 
-            evs = rdo.get('events', [])
-            if any(flag & (select.POLLHUP | select.POLLERR | select.POLLNVAL)
-                    for _, flag in evs):                                                # Handle poll errors
+            ev_mask = rdo.ev_mask
+            if ev_mask & _POLL_ERR_MASK:                                                # Handle poll errors
                 self._cleanup_socket(role)
                 self.reconnect_socket(now, role)                                        # Socket keep-alive
                 continue
-            if any(flag & select.POLLIN for _, flag in evs):                            # Read and process incoming data
+            if ev_mask & pollin:                                                        # Read and process incoming data
                 self._process_incoming(role, now)
 
-            self.reconnect_socket(now, role)                                            # Socket keep-alive
-            self._freq_check_timeout(role, now)                                         # Reply timeouts
+            if rdo.sock is None or not enabled(role):                                   # Socket keep-alive: only enter
+                self.reconnect_socket(now, role)                                        # when a (re)connect or teardown
+                                                                                        # can actually happen
+            if rdo.is_busy is not None:                                                 # Reply timeouts
+                self._freq_check_timeout(role, now)
 
         self._update_sync_state()                                                       # Update sync state (On/Off)
         self._apply_sync_actions()                                                      # Apply sync actions
 
-        for role, rdo in self.radio.items():                                            ##### Queue frequency queries
+        for role, rdo in role_items:                                                    ##### Queue frequency queries
+            if (rdo.sock is not None                                                    # Mirror of the _freq_query run
+                    and rdo.is_busy is None                                             # conditions: skip the call frame
+                    and rdo.freq_queued is None                                         # whenever it would just return
+                    and (now - rdo.send_timestamp) >= rdo.freq_query_interval):
+                self._freq_query(role, now)
 
-            if (rdo['freq_cur'] is None                                                 # Ensure that we have a freq
-                    and rdo['freq_queued'] is None
-                    and rdo['query'] is None
-                    and rdo['is_busy'] is None):
-                if self.ifreq is not None and role == 'gqrx':
-                    rdo['query'] = b"LNB_LO\n"
-                else:
-                    rdo['query'] = b"f\n"                                               # Query frequency
-                self._update_poll_mask(role)
-
-            self._freq_query(role, now)
-
-        for role, rdo in self.radio.items():                                            ##### Send commands
-            evs = rdo.get('events', [])
-            writable = any(flag & select.POLLOUT for _, flag in evs)                    # Write outgoing data
+        pollout = select.POLLOUT
+        for role, rdo in role_items:                                                    ##### Send commands
+            writable = rdo.ev_mask & pollout                                         # Write outgoing data
             if writable and not self._check_connect(role):                              # Check connect result
                 continue
-            if not rdo['connected']:
+            if not rdo.connected:
                 continue
             if not self._has_pending_output(role):
                 self._update_poll_mask(role)
@@ -190,7 +227,7 @@ class SyncManager:
                                                                                         ##### Once per tick actions
         self._log_rig_change(self.cfg.sync.wait_before_log_rigfreq, now)                # Log Frequency
         self._update_band()                                                             # Update band name
-        self._update_ui()                                                               # Update display
+        self._update_ui(now)                                                            # Update display
 
     def nudge(self, delta_hz):
         """Queue a live frequency change from keyboard, mouse, or external VFO knob."""
@@ -198,24 +235,24 @@ class SyncManager:
             # If rig present, nudge rig. If rig not present, nudge gqrx.
             for role in ('rig', 'gqrx'):
                 rdo = self.radio[role]
-                if rdo['sock'] is not None and rdo['connected'] and self.devices.enabled(role):
+                if rdo.sock is not None and rdo.connected and self.devices.enabled(role):
                     base_freq = self._effective_freq(role)
                     if base_freq is None:
                         return
 
                     new_freq = base_freq + delta_hz
 
-                    if rdo['freq_cur'] is not None:
+                    if rdo.freq_cur is not None:
                         max_delta = abs(int(self.step.get_step())) * self.cfg.sync.nudge_buffer
-                        if max_delta > 0 and abs(new_freq - rdo['freq_cur']) > max_delta:
-                            if self.logger.is_enabled("DEBUG"):
-                                self.logger.log(f"{role.upper()} NUDGE BUFFER FULL", "DEBUG")
+                        if max_delta > 0 and abs(new_freq - rdo.freq_cur) > max_delta:
+                            if self._debug_on:
+                                self.logger.log(f"{rdo.role_upper} NUDGE BUFFER FULL", "DEBUG")
                             return
 
                     is_lo = self.ifreq is not None and role == 'gqrx'
                     if self._queue_set(role, new_freq, is_lo=is_lo):
-                        if self.logger.is_enabled("DEBUG"):
-                            self.logger.log(f"{role.upper()} NUDGE QUEUED {new_freq}", "DEBUG")
+                        if self._debug_on:
+                            self.logger.log(f"{rdo.role_upper} NUDGE QUEUED {new_freq}", "DEBUG")
                     break
         except (KeyError, AttributeError, TypeError, ValueError) as e:
             self.logger.log(f"[NUDGE ERROR]: {e}", "CRITICAL")
@@ -226,21 +263,21 @@ class SyncManager:
             rig = self.radio['rig']
             gqrx = self.radio['gqrx']
             rig_ok = (
-                    rig['sock'] is not None
-                    and rig['connected']
-                    and rig['freq_cur'] is not None
+                    rig.sock is not None
+                    and rig.connected
+                    and rig.freq_cur is not None
             )
             gqrx_ok = (
-                    gqrx['sock'] is not None
-                    and gqrx['connected']
-                    and gqrx['freq_cur'] is not None
+                    gqrx.sock is not None
+                    and gqrx.connected
+                    and gqrx.freq_cur is not None
             )
             if rig_ok:
-                return rig['freq_cur']
+                return rig.freq_cur
             if gqrx_ok:
                 if self.ifreq is not None:
-                    return gqrx['freq_cur'] + self.ifreq_hz
-                return gqrx['freq_cur']
+                    return gqrx.freq_cur + self.ifreq_hz
+                return gqrx.freq_cur
             return None
         except (KeyError, TypeError) as e:
             self.logger.log(f"SYNC GET FREQ ERROR {e}", "ERROR")
@@ -255,13 +292,13 @@ class SyncManager:
                     tgt = role
                 else:
                     rig_ok = (
-                        self.radio['rig']['sock'] is not None
-                        and self.radio['rig']['connected']
+                        self.radio['rig'].sock is not None
+                        and self.radio['rig'].connected
                         and self.devices.enabled('rig')
                     )
                     gqx_ok = (
-                        self.radio['gqrx']['sock'] is not None
-                        and self.radio['gqrx']['connected']
+                        self.radio['gqrx'].sock is not None
+                        and self.radio['gqrx'].connected
                         and self.devices.enabled('gqrx')
                     )
                     tgt = 'rig' if rig_ok else ('gqrx' if gqx_ok else None)
@@ -279,11 +316,11 @@ class SyncManager:
             if role in self.radio:
                 tgt = role
             else:
-                rig_ok = (self.radio['rig']['sock'] is not None
-                    and self.radio['rig']['connected']
+                rig_ok = (self.radio['rig'].sock is not None
+                    and self.radio['rig'].connected
                     and self.devices.enabled('rig'))
-                gqx_ok = (self.radio['gqrx']['sock'] is not None
-                    and self.radio['gqrx']['connected']
+                gqx_ok = (self.radio['gqrx'].sock is not None
+                    and self.radio['gqrx'].connected
                     and self.devices.enabled('gqrx'))
                 tgt = 'rig' if rig_ok else ('gqrx' if gqx_ok else None)
             if tgt is None:
@@ -306,23 +343,24 @@ class SyncManager:
 
             return self.set_frequency(int(round(goto_mhz * 1_000_000)))
         except (TypeError, ValueError, KeyError) as e:
-            self.logger.log(f"[BAND STEP ERROR] {e}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"[BAND STEP ERROR] {e}", "DEBUG")
             return False
 
     def set_sync_mode(self, state):
         """Enable or disable synchronization on user request"""
         self._wanted_sync = state
-        if (self.radio['rig']['sock'] is None
-                or not self.radio['rig']['connected']
-                or self.radio['gqrx']['sock'] is None
-                or not self.radio['gqrx']['connected']):
+        if (self.radio['rig'].sock is None
+                or not self.radio['rig'].connected
+                or self.radio['gqrx'].sock is None
+                or not self.radio['gqrx'].connected):
             state = False
         self.sync_on = state
 
     def reconnect_socket(self, now, role):
         """If socket not present for registered device, create a new one."""
         rdo = self.radio[role]
-        if self.devices.enabled(role) and rdo['sock'] is None and now - rdo['recon_timestamp'] > rdo['recon_interval']:
+        if self.devices.enabled(role) and rdo.sock is None and now - rdo.recon_timestamp > rdo.recon_interval:
             rdo.update({                                                                # Reset stale state
                 'connected'                   : False,
                 'freq_cur'                    : None,
@@ -334,31 +372,33 @@ class SyncManager:
                 'recv_buf'                    : bytearray(),
                 'poll_mask'                   : None,
                 'query'                       : None,
-                'events'                      : []
+                'ev_mask'                     : 0
             })
 
             if self.ifreq is not None and role == 'gqrx':
-                self.radio['rig']['freq_processed'] = None                              # Force LO resync
+                self.radio['rig'].freq_processed = None                              # Force LO resync
 
-            rdo['recon_timestamp'] = now
+            rdo.recon_timestamp = now
             sock = None
             try:
-                sock = self._connect_socket(rdo['host'], rdo['port'])
+                sock = self._connect_socket(rdo.host, rdo.port)
                 self._register_socket(role, sock)
             except OSError as e:
-                self.logger.log(f"{role.upper()} CONNECT CREATE ERROR {e}", "DEBUG")
+                if self._debug_on:
+                    self.logger.log(f"{rdo.role_upper} CONNECT CREATE ERROR {e}", "DEBUG")
                 if sock is not None:
                     try:
                         sock.close()
                     except OSError:
                         pass
-                rdo['sock'] = None
+                rdo.sock = None
                 return
 
-            rdo['sock'] = sock
-            self.logger.log(f"Created new socket for {role}", "DEBUG")
+            rdo.sock = sock
+            if self._debug_on:
+                self.logger.log(f"Created new socket for {role}", "DEBUG")
 
-        elif not self.devices.enabled(role) and rdo['sock']:
+        elif not self.devices.enabled(role) and rdo.sock:
             self._cleanup_socket(role)
             self.logger.log(f"Destroyed socket for  {role}", "WARNING")
 
@@ -382,7 +422,7 @@ class SyncManager:
             keys = [role]
         for key in keys:
             rdo = self.radio[key]
-            if rdo['sock']:                                                             # Unregister & close socket
+            if rdo.sock:                                                             # Unregister & close socket
                 self._cleanup_socket(key)
 
             rdo.update({                                                                # Reset status
@@ -399,7 +439,7 @@ class SyncManager:
                 'poll_mask'                   : None,
                 'recv_buf'                    : bytearray(),
                 'query'                       : None,
-                'events'                      : []
+                'ev_mask'                     : 0
             })
 
         if role is None:
@@ -413,21 +453,27 @@ class SyncManager:
     # # #   UI Update   # # #
     # # # # # # # # # # # # #
 
-    def _update_ui(self):
+    def _update_ui(self, now):
         """Write values to user interface when display state changed."""
         if self.display is None:
             return
+        if now - self._last_ui_refresh < self._UI_REFRESH_INTERVAL:                     # ~30 Hz is plenty for a
+            return                                                                      # terminal display
+        self._last_ui_refresh = now
         try:
+            if self._ui_setters is None:                                                # bind set_rig/set_gqrx once
+                self._ui_setters = {role: getattr(self.display, f"set_{role}")
+                                    for role in self.radio}
             updates = []
             ui_state = [self.sync_on]
             for role, rdo in self.radio.items():
-                connected = rdo['sock'] is not None and rdo['connected']
+                connected = rdo.sock is not None and rdo.connected
                 if not connected:
                     freq = None
                     setter_connected = None
                 else:
-                    setter_connected = rdo['sock']
-                    base = rdo['freq_cur']
+                    setter_connected = rdo.sock
+                    base = rdo.freq_cur
                     if self.ifreq is not None and base is not None and role == 'gqrx':
                         freq = base + self.ifreq_hz
                     else:
@@ -441,8 +487,7 @@ class SyncManager:
             self.display.set_sync_mode(self.sync_on)
 
             for role, freq, setter_connected in updates:
-                setter = getattr(self.display, f"set_{role}")
-                setter(freq, setter_connected)
+                self._ui_setters[role](freq, setter_connected)
             self._last_ui_state = ui_state
 
         except (AttributeError, TypeError, KeyError) as e:
@@ -454,7 +499,7 @@ class SyncManager:
 
     def _update_sync_state(self):
         """Disable sync on only one active radio; restore if both present, and it has been enabled before."""
-        if any(rdo['sock'] is None or not rdo['connected'] for rdo in self.radio.values()):
+        if any(rdo.sock is None or not rdo.connected for rdo in self.radio.values()):
             self.sync_on = False
         else:
             if self._wanted_sync and not self.sync_on:
@@ -469,76 +514,82 @@ class SyncManager:
             return
         self._last_band_freq_hz = freq_hz
         if freq_hz is None:
-            self.display.set_band_name("")
+            band_name = ""
+        else:
+            band_name = self.bands.band_name_hz(freq_hz)
+        if band_name == self._last_band_name:                                           # Same band, nothing to redraw
             return
-        band_name = self.bands.band_name(freq_hz / 1_000_000)
+        self._last_band_name = band_name
         self.display.set_band_name(band_name)
 
     def _effective_freq(self, role):
         """Return the newest intended frequency for a radio."""
         rdo = self.radio[role]
-        if rdo['freq_queued'] is not None:
-            return rdo['freq_queued']
-        if rdo['freq_sent'] is not None:
-            return rdo['freq_sent']
-        return rdo['freq_cur']
+        if rdo.freq_queued is not None:
+            return rdo.freq_queued
+        if rdo.freq_sent is not None:
+            return rdo.freq_sent
+        return rdo.freq_cur
 
     def _confirmed_freq(self, role, freq_hz):
         """Return True if this radio has confirmed this frequency."""
         rdo = self.radio[role]
         return (
-            rdo['freq_cur'] == freq_hz
-            and rdo['freq_sent'] is None
-            and rdo['freq_queued'] is None
+            rdo.freq_cur == freq_hz
+            and rdo.freq_sent is None
+            and rdo.freq_queued is None
         )
 
     def _freq_unprocessed(self, role):
         """Return True if the newest intended frequency has not yet been handled by sync."""
         freq = self._effective_freq(role)
         rdo = self.radio[role]
-        return freq is not None and freq != rdo['freq_processed']
+        return freq is not None and freq != rdo.freq_processed
 
     def _queue_set(self, role, freq_hz, is_lo=False, mark_processed=False):
         """Queue the latest wanted set frequency."""
         rdo = self.radio[role]
 
-        if rdo['sock'] is None or not rdo['connected'] or not self.devices.enabled(role):
+        if rdo.sock is None or not rdo.connected or not self.devices.enabled(role):
             return False
 
         freq_hz = int(freq_hz)
 
         if mark_processed:
-            rdo['freq_processed'] = freq_hz
+            rdo.freq_processed = freq_hz
 
-        if rdo['freq_sent'] == freq_hz:                                               # Already in flight
-            rdo['freq_queued'] = None
-            rdo['freq_queued_is_lo'] = False
-            rdo['query'] = None                                                       # Drop pending query
+        if rdo.freq_sent == freq_hz:                                               # Already in flight
+            rdo.freq_queued = None
+            rdo.freq_queued_is_lo = False
+            rdo.query = None                                                       # Drop pending query
             self._update_poll_mask(role)
             return True
 
-        rdo['freq_queued'] = freq_hz
-        rdo['freq_queued_is_lo'] = is_lo
-        rdo['query'] = None                                                           # Set overwrites query
-        if self.logger.is_enabled("DEBUG"):
-            self.logger.log(f"{role.upper()} SET QUEUED {freq_hz}", "DEBUG")
+        rdo.freq_queued = freq_hz
+        rdo.freq_queued_is_lo = is_lo
+        rdo.query = None                                                           # Set overwrites query
+        if self._debug_on:
+            self.logger.log(f"{rdo.role_upper} SET QUEUED {freq_hz}", "DEBUG")
         self._update_poll_mask(role)
         return True
 
     def _apply_sync_actions(self):
         """Perform synchronization actions."""
 
-        rig = self.radio['rig']
-        gqrx = self.radio['gqrx']
         rig_changed = self._freq_unprocessed('rig')
         gqrx_changed = self._freq_unprocessed('gqrx')
+        if not rig_changed and not gqrx_changed:                                        # Steady state: nothing to sync
+            return
+
+        rig = self.radio['rig']
+        gqrx = self.radio['gqrx']
 
         if (not self.sync_on                                                            # Run Conditions
-                or rig['sock'] is None
-                or not rig['connected']
+                or rig.sock is None
+                or not rig.connected
                 or not self.devices.enabled('rig')
-                or gqrx['sock'] is None
-                or not gqrx['connected']
+                or gqrx.sock is None
+                or not gqrx.connected
                 or not self.devices.enabled('gqrx')
                 or self._effective_freq('rig') is None
                 or (self._effective_freq('gqrx') is None and self.ifreq is None)):
@@ -549,24 +600,24 @@ class SyncManager:
                 target_freq = self._effective_freq('rig')
                 if self._effective_freq('gqrx') == target_freq:
                     if self._confirmed_freq('gqrx', target_freq):
-                        rig['freq_processed'] = target_freq
-                        gqrx['freq_processed'] = target_freq
+                        rig.freq_processed = target_freq
+                        gqrx.freq_processed = target_freq
                     return
                 if not self._queue_set('gqrx', target_freq, mark_processed=True):
                     return
-                if self.logger.is_enabled("DEBUG"):
+                if self._debug_on:
                     self.logger.log(f"RIG CHANGE DIRECT SYNC {target_freq}", "DEBUG")
 
             elif gqrx_changed:
                 target_freq = self._effective_freq('gqrx')
                 if self._effective_freq('rig') == target_freq:
                     if self._confirmed_freq('rig', target_freq):
-                        gqrx['freq_processed'] = target_freq
-                        rig['freq_processed'] = target_freq
+                        gqrx.freq_processed = target_freq
+                        rig.freq_processed = target_freq
                     return
                 if not self._queue_set('rig', target_freq, mark_processed=True):
                     return
-                if self.logger.is_enabled("DEBUG"):
+                if self._debug_on:
                     self.logger.log(f"GQRX CHANGE DIRECT SYNC {target_freq}", "DEBUG")
             return
 
@@ -576,12 +627,12 @@ class SyncManager:
                 lo_freq = rig_freq - self.ifreq_hz
                 if self._effective_freq('gqrx') == lo_freq:
                     if self._confirmed_freq('gqrx', lo_freq):
-                        rig['freq_processed'] = rig_freq
-                        gqrx['freq_processed'] = lo_freq
+                        rig.freq_processed = rig_freq
+                        gqrx.freq_processed = lo_freq
                     return
                 if not self._queue_set('gqrx', lo_freq, is_lo=True, mark_processed=True):
                     return
-                if self.logger.is_enabled("DEBUG"):
+                if self._debug_on:
                     self.logger.log(f"RIG CHANGE IFREQ SYNC {rig_freq}", "DEBUG")
 
     # # # # # # # # # # # # # # # # # # # # #
@@ -589,8 +640,11 @@ class SyncManager:
     # # # # # # # # # # # # # # # # # # # # #
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _build_cat_cmd(freq, is_lo=False):
-        """Construct CAT query to set Frequency or Local Oscillator."""
+        """Construct CAT query to set Frequency or Local Oscillator.
+        Cached: sync retries and repeated nudges to the same frequency
+        reuse the encoded bytes instead of re-running str(freq).encode()."""
         prefix = b"LNB_LO " if is_lo else b"F "
         return prefix + str(freq).encode() + b"\n"
 
@@ -598,79 +652,81 @@ class SyncManager:
         """Query frequency"""
         rdo = self.radio[role]
 
-        if ((now - rdo['send_timestamp']) < rdo['freq_query_interval']                  # Run conditions
-                or rdo['sock'] is None
-                or rdo['is_busy'] is not None
-                or rdo['freq_queued'] is not None
-                or self.ifreq is not None and role == 'gqrx'):                          # No freq query to gqrx in ifreq mode.
+        if ((now - rdo.send_timestamp) < rdo.freq_query_interval                  # Run conditions
+                or rdo.sock is None
+                or rdo.is_busy is not None
+                or rdo.freq_queued is not None):
+            return
+                                                                                        # In ifreq mode gqrx is only
+        if self.ifreq is not None and role == 'gqrx' and rdo.freq_cur is not None:   # queried until the LO is known
             return
 
-        if rdo['query'] is None:                                                         # FreqQueryCmd, not overwriting
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} FREQ QUERY CMD", "DEBUG")
-            rdo['query'] = b"f\n"
+        if rdo.query is None:                                                         # FreqQueryCmd, not overwriting
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} FREQ QUERY CMD", "DEBUG")
+            rdo.query = rdo.query_cmd
             self._update_poll_mask(role)
 
     def _freq_check_timeout(self, role, now):
         """Check query-reply-timeouts."""
         rdo = self.radio[role]
-        if rdo['is_busy'] is None:
+        if rdo.is_busy is None:
             return
-        if now - rdo['is_busy'] <= rdo['timeout']:
+        if now - rdo.is_busy <= rdo.timeout:
             return
-        if self.logger.is_enabled("DEBUG"):
-            self.logger.log(f"[TIMEOUT ERROR] {role.upper()} did not ack in {rdo['timeout']}s", "DEBUG")
+        if self._debug_on:
+            self.logger.log(f"[TIMEOUT ERROR] {rdo.role_upper} did not ack in {rdo.timeout}s", "DEBUG")
 
-        if rdo['freq_sent'] is not None:
-            if rdo['freq_processed'] == rdo['freq_sent']:
-                rdo['freq_processed'] = rdo['freq_cur']
-            rdo['freq_sent'] = None
+        if rdo.freq_sent is not None:
+            if rdo.freq_processed == rdo.freq_sent:
+                rdo.freq_processed = rdo.freq_cur
+            rdo.freq_sent = None
 
-        rdo['recv_buf'] = bytearray()                                                   # Drop stale partial data
-        rdo['is_busy'] = None
+        rdo.recv_buf = bytearray()                                                   # Drop stale partial data
+        rdo.is_busy = None
         self._update_poll_mask(role)
 
     def _send_query(self, role, now):
         """Send pending queries for the specified role when its socket is writable."""
         rdo = self.radio[role]
 
-        if (rdo['sock'] is None                                                         # Run conditions
-                or not rdo['connected']
-                or rdo['is_busy'] is not None
+        if (rdo.sock is None                                                         # Run conditions
+                or not rdo.connected
+                or rdo.is_busy is not None
                 or not self.devices.enabled(role)):
             return
 
-        if rdo['freq_queued'] is not None:                                              # Set has priority
-            query = self._build_cat_cmd(rdo['freq_queued'], is_lo=rdo['freq_queued_is_lo'])
+        if rdo.freq_queued is not None:                                              # Set has priority
+            query = self._build_cat_cmd(rdo.freq_queued, is_lo=rdo.freq_queued_is_lo)
             is_set = True
-        elif rdo['query'] is not None:
-            query = rdo['query']
+        elif rdo.query is not None:
+            query = rdo.query
             is_set = False
         else:
             return
 
         try:                                                                            # Send to Socket
-            rdo['sock'].sendall(query)
+            rdo.sock.sendall(query)
         except BlockingIOError:
             self._update_poll_mask(role)
             return
         except OSError as e:
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} SEND ERROR {e}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} SEND ERROR {e}", "DEBUG")
             self._cleanup_socket(role)
             return
 
         if is_set:
-            rdo['freq_sent'] = rdo['freq_queued']
-            rdo['freq_queued'] = None
-            rdo['freq_queued_is_lo'] = False
+            rdo.freq_sent = rdo.freq_queued
+            rdo.freq_queued = None
+            rdo.freq_queued_is_lo = False
 
-        if self.logger.is_enabled("DEBUG"):
-            self.logger.log(f"{role.upper()} SEND {query}", "DEBUG")
-        rdo['is_busy'] = now                                                            # Set busy flag
+        if self._debug_on:
+            self.logger.log(f"{rdo.role_upper} SEND {query}", "DEBUG")
+        rdo.is_busy = now                                                            # Set busy flag
 
-        rdo['send_timestamp'] = now
-        rdo['query'] = None
+        rdo.send_timestamp = now
+        rdo.query = None
         self._update_poll_mask(role)
 
     def _process_incoming(self, role, now):
@@ -678,102 +734,110 @@ class SyncManager:
         rdo = self.radio[role]
 
         try:                                                                            # Read socket
-            data = rdo['sock'].recv(self.cfg.sync.read_buffer_size)
+            recv_into = getattr(rdo.sock, 'recv_into', None)
+            if recv_into is not None:                                                   # fill scratch in place, no
+                n = recv_into(rdo.recv_mv)                                           # per-call bytes allocation
+                data = rdo.recv_mv[:n]
+            else:                                                                       # socket stand-ins without
+                data = rdo.sock.recv(self.cfg.sync.read_buffer_size)                 # recv_into support
         except OSError as e:
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} RECV ERROR] {e}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} RECV ERROR] {e}", "DEBUG")
             self._cleanup_socket(role)
             return
 
         if not data:
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"[DEBUG] {role.upper()} SOCKET DIED", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"[DEBUG] {rdo.role_upper} SOCKET DIED", "DEBUG")
             self._cleanup_socket(role)
             return
 
-        if rdo['is_busy'] is None:                                                      # Got response, but not busy
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} ERROR Response while not busy: {data}", "DEBUG")
-            rdo['recv_buf'] = bytearray()                                               # Drop stale response data
+        if rdo.is_busy is None:                                                      # Got response, but not busy
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} ERROR Response while not busy: {bytes(data)}", "DEBUG")
+            rdo.recv_buf = bytearray()                                               # Drop stale response data
             return
 
-        buf = rdo['recv_buf']                                                           # Build buffer and trim it
+        buf = rdo.recv_buf                                                           # Build buffer and trim it
         buf.extend(data)
         if len(buf) > self.cfg.sync.max_read_buffer_bytes:
             del buf[0:len(buf) - self.cfg.sync.max_read_buffer_bytes]
 
-        parts = buf.split(b'\n')
-        complete = parts[:-1]
-        incomplete = parts[-1]
-        if not complete:
-            rdo['recv_buf'] = bytearray(incomplete)                                     # Preserve incomplete tail
-            return
+        nl = buf.find(b'\n')                                                            # Scan lines in place
+        if nl < 0:
+            return                                                                      # Incomplete tail stays buffered
 
-        for part in complete:
-            part = part.strip()
+        start = 0
+        while nl >= 0:
+            part = buf[start:nl].strip()
+            start = nl + 1
+            nl = buf.find(b'\n', start)
             if not part:
                 continue
+            self._handle_reply(role, rdo, part, now)
+        del buf[:start]                                                                 # Compact consumed lines in place
+        rdo.is_busy = None                                                           # Clear Busy
+        self._update_poll_mask(role)                                                    # Activate POLLOUT
 
-            is_error = False
-            freq = None
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} RECEIVED {part.decode(errors='replace')}", "DEBUG")
+    def _handle_reply(self, role, rdo, part, now):
+        """Process a single complete reply line from Rig/Gqrx."""
+        is_error = False
+        freq = None
+        if self._debug_on:
+            self.logger.log(f"{rdo.role_upper} RECEIVED {part.decode(errors='replace')}", "DEBUG")
 
-            if part.startswith(b"RPRT"):                                                # WRITE REPORT
-                try:
-                    _, code = part.split(b" ", 1)
-                except ValueError:
-                    if self.logger.is_enabled("DEBUG"):
-                        self.logger.log(
-                            f"ERROR {role.upper()} MALFORMED RPRT RESPONSE: {part.decode(errors='replace')}", "DEBUG")
-                    is_error = True
-                    code = None
-
-                if code and code == b"0":                                                ##### Success Report
-                    if self.logger.is_enabled("DEBUG"):
-                        self.logger.log(f"{role.upper()} RPRT SUCCESS", "DEBUG")
-                    if rdo['freq_sent'] is not None:
-                        new_freq = rdo['freq_sent']
-                        if new_freq != rdo['freq_cur']:
-                            if role == 'rig':
-                                self._last_rig_change = now
-                                self._rig_reported = False
-                            rdo['freq_cur'] = new_freq
-
-                        rdo['freq_sent'] = None
-
-                else:                                                                   # Error Report
-                    is_error = True
-                    code_text = code.decode() if code is not None else "UNKNOWN"
-                    if self.logger.is_enabled("DEBUG"):
-                        self.logger.log(f"{role.upper()} ERROR RPRT {code_text}", "DEBUG")
+        if part.startswith(b"RPRT"):                                                    # WRITE REPORT
+            try:
+                _, code = part.split(b" ", 1)
+            except ValueError:
+                if self._debug_on:
+                    self.logger.log(
+                        f"ERROR {rdo.role_upper} MALFORMED RPRT RESPONSE: {part.decode(errors='replace')}", "DEBUG")
+                is_error = True
+                code = None
+
+            if code and code == b"0":                                                    ##### Success Report
+                if self._debug_on:
+                    self.logger.log(f"{rdo.role_upper} RPRT SUCCESS", "DEBUG")
+                if rdo.freq_sent is not None:
+                    new_freq = rdo.freq_sent
+                    if new_freq != rdo.freq_cur:
+                        if role == 'rig':
+                            self._last_rig_change = now
+                            self._rig_reported = False
+                        rdo.freq_cur = new_freq
+
+                    rdo.freq_sent = None
+
+            else:                                                                       # Error Report
+                is_error = True
+                code_text = code.decode() if code is not None else "UNKNOWN"
+                if self._debug_on:
+                    self.logger.log(f"{rdo.role_upper} ERROR RPRT {code_text}", "DEBUG")
 
-            else:
-                try:                                                                    ##### READ FREQUENCY
-                    freq = int(part)
-                except ValueError:
-                    is_error = True
-                    freq = None
-                    if self.logger.is_enabled("DEBUG"):
-                        self.logger.log(f"{role.upper()} ERROR RESPONSE UNKNOWN: {part.decode(errors='replace')}", "DEBUG")
-
-            if freq is not None:
-                if freq != rdo['freq_cur']:                                             # New frequency present
-                    if role == 'rig':                                                   # Logging
-                        self._last_rig_change = now
-                        self._rig_reported = False
-                    rdo['freq_cur'] = freq
-
-            if is_error:                                                                # Clear sent state on error
-                if self.logger.is_enabled("DEBUG"):
-                    self.logger.log(f"{role.upper()} ERROR IN RECEIVED DATA", "DEBUG")
-                if rdo['freq_sent'] is not None:
-                    if rdo['freq_processed'] == rdo['freq_sent']:
-                        rdo['freq_processed'] = rdo['freq_cur']
-                    rdo['freq_sent'] = None
-        rdo['recv_buf'] = bytearray(incomplete)                                         # Preserve incomplete tail
-        rdo['is_busy'] = None                                                           # Clear Busy
-        self._update_poll_mask(role)                                                    # Activate POLLOUT
+        else:
+            try:                                                                        ##### READ FREQUENCY
+                freq = int(part)
+            except ValueError:
+                is_error = True
+                freq = None
+                if self._debug_on:
+                    self.logger.log(f"{rdo.role_upper} ERROR RESPONSE UNKNOWN: {part.decode(errors='replace')}", "DEBUG")
+
+        if freq is not None:
+            if freq != rdo.freq_cur:                                                 # New frequency present
+                if role == 'rig':                                                       # Logging
+                    self._last_rig_change = now
+                    self._rig_reported = False
+                rdo.freq_cur = freq
+
+        if is_error:                                                                    # Clear sent state on error
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} ERROR IN RECEIVED DATA", "DEBUG")
+            if rdo.freq_sent is not None:
+                if rdo.freq_processed == rdo.freq_sent:
+                    rdo.freq_processed = rdo.freq_cur
+                rdo.freq_sent = None
 
     # # # # # # # # # # # # # #
     # # # Socket Handling # # #
@@ -782,27 +846,27 @@ class SyncManager:
     def _check_connect(self, role):
         """Check non-blocking socket connect result."""
         rdo = self.radio[role]
-        sock = rdo['sock']
+        sock = rdo.sock
 
         if sock is None:
             return False
-        if rdo['connected']:
+        if rdo.connected:
             return True
         try:
             err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
         except OSError as e:
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} CONNECT CHECK ERROR {e}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} CONNECT CHECK ERROR {e}", "DEBUG")
             self._cleanup_socket(role)
             return False
         if err:
-            if self.logger.is_enabled("DEBUG"):
-                self.logger.log(f"{role.upper()} CONNECT ERROR {err}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} CONNECT ERROR {err}", "DEBUG")
             self._cleanup_socket(role)
             return False
-        rdo['connected'] = True
-        if self.logger.is_enabled("DEBUG"):
-            self.logger.log(f"{role.upper()} CONNECTED", "DEBUG")
+        rdo.connected = True
+        if self._debug_on:
+            self.logger.log(f"{rdo.role_upper} CONNECTED", "DEBUG")
         self._update_poll_mask(role)
         return True
 
@@ -811,6 +875,7 @@ class SyncManager:
         """Create non-blocking socket and connect to it"""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)                     # room for burst replies
         sock.setblocking(False)
         sock.connect_ex((host, port))
         return sock
@@ -821,12 +886,12 @@ class SyncManager:
         mask = select.POLLIN | select.POLLOUT
         self._poller.register(fd, mask)
         self._fd_map[fd] = role
-        self.radio[role]['poll_mask'] = mask
+        self.radio[role].poll_mask = mask
 
     def _cleanup_socket(self, role):
         """Unregister, close, clear buffer, disable sync."""
         rdo = self.radio[role]
-        sock = rdo['sock']
+        sock = rdo.sock
 
         if sock:
             try:                                                                        # unregister from poller
@@ -849,9 +914,9 @@ class SyncManager:
             'freq_sent'                   : None,
             'freq_queued'                 : None,
             'freq_queued_is_lo'           : False,
-            'freq_processed'              : rdo['freq_cur'],
+            'freq_processed'              : rdo.freq_cur,
             'poll_mask'                   : None,
-            'events'                      : []
+            'ev_mask'                     : 0
         })
         self.sync_on = False
 
@@ -862,16 +927,16 @@ class SyncManager:
     def _has_pending_output(self, role):
         """Return True if a command is waiting to be sent."""
         rdo = self.radio[role]
-        return rdo['freq_queued'] is not None or rdo['query'] is not None
+        return rdo.freq_queued is not None or rdo.query is not None
 
     def _needs_pollout(self, role):
         """Return True if this socket should currently be watched for writability."""
         rdo = self.radio[role]
-        if rdo['sock'] is None or not self.devices.enabled(role):
+        if rdo.sock is None or not self.devices.enabled(role):
             return False
-        if not rdo['connected']:
+        if not rdo.connected:
             return True
-        if rdo['is_busy'] is not None:
+        if rdo.is_busy is not None:
             return False
         return self._has_pending_output(role)
 
@@ -885,7 +950,7 @@ class SyncManager:
     def _update_poll_mask(self, role):
         """Update poll mask for an already registered socket."""
         rdo = self.radio[role]
-        sock = rdo['sock']
+        sock = rdo.sock
         if sock is None:
             return
         try:
@@ -901,15 +966,16 @@ class SyncManager:
         if self._fd_map.get(fd) != role:
             return
         mask = self._wanted_poll_mask(role)
-        if rdo.get('poll_mask') == mask:
+        if rdo.poll_mask == mask:
             return
         try:
             self._poller.modify(fd, mask)
         except (OSError, ValueError, KeyError) as e:
-            self.logger.log(f"{role.upper()} POLL MODIFY ERROR {e}", "DEBUG")
+            if self._debug_on:
+                self.logger.log(f"{rdo.role_upper} POLL MODIFY ERROR {e}", "DEBUG")
             self._cleanup_socket(role)
             return
-        rdo['poll_mask'] = mask
+        rdo.poll_mask = mask
 
 
     # # # # # # # # # # # # # # # # #
@@ -920,7 +986,7 @@ class SyncManager:
         """Log Rig frequency"""
         if self.log_file is None or self._last_rig_change is None or self._rig_reported:
             return
-        freq = self.radio['rig']['freq_cur']
+        freq = self.radio['rig'].freq_cur
         if freq is None:
             return
         if now - self._last_rig_change > wait:
@@ -4,6 +4,24 @@ pansyncer utils.py
 
 import sys
 
+def _noop(*_args, **_kwargs):
+    return None
+
+class NullDisplay:
+    """Daemon-mode display stand-in. Every setter resolves to a shared no-op,
+    so per-event handlers can call display methods unconditionally instead of
+    branching on `if self.display:`. It is falsy on purpose: code outside the
+    hot paths that still tests the display for truthiness behaves as if no
+    display were attached."""
+
+    def __bool__(self):
+        return False
+
+    def __getattr__(self, _name):
+        return _noop
+
+NULL_DISPLAY = NullDisplay()
+
 def beep():
     """ Send ANSI BEL to terminal."""
     out = sys.stdout
@@ -20,6 +20,14 @@ def test_band_end_is_inclusive():
     assert bands.band_name(14.350) == " 20m"
 
 
+def test_band_name_hz_matches_mhz_lookup():
+    bands = Bands()
+
+    assert bands.band_name_hz(14_200_000) == " 20m"
+    assert bands.band_name_hz(13_999_000) == "OOB"
+    assert bands.band_name_hz(14_350_000) == " 20m"
+
+
 def test_band_step_up_from_inside_band():
     bands = Bands()
 
@@ -137,4 +145,9 @@ def test_bands_repairs_invalid_goto_to_midpoint_on_100_hz_grid():
 
     bands = Bands(source)
 
-    assert bands.step(1.0001, 1) is False
\ No newline at end of file
+    assert bands.step(1.0001, 1) is False
+
+def test_classify_batch_maps_frequencies_to_band_indices():
+    bands = Bands()
+
+    assert list(bands.classify_batch([14.200, 13.999, 1.810, 60.0])) == [5, -1, 0, -1]
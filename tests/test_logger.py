@@ -159,4 +159,25 @@ def test_logger_is_enabled_returns_false_for_inactive_level():
         assert logger.is_enabled("INFO") is False
         assert logger.is_enabled("WARNING") is True
     finally:
-        logger.close()
\ No newline at end of file
+        logger.close()
+
+def test_logger_debug_builds_message_only_when_level_active():
+    display = FakeDisplay()
+    logger = Logger("test_logger_debug_lazy", display=display, level="WARNING")
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "expensive"
+
+    try:
+        logger.debug(build)
+        assert calls == []
+        assert display.lines == []
+
+        logger.logger.setLevel("DEBUG")
+        logger.debug(build)
+        assert calls == [1]
+        assert display.lines == ["[DEBUG] expensive"]
+    finally:
+        logger.close()
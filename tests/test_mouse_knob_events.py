@@ -232,7 +232,7 @@ def test_knob_volume_up_nudges_positive_step_and_sets_indicator():
     knob.handle_events(sync, step)
 
     assert sync.nudges == [100]
-    assert display.step_values == [100]
+    assert display.step_values == []
     assert display.knob_inputs == ["UP "]
 
 
@@ -247,7 +247,7 @@ def test_knob_volume_down_nudges_negative_step_and_sets_indicator():
     knob.handle_events(sync, step)
 
     assert sync.nudges == [-100]
-    assert display.step_values == [100]
+    assert display.step_values == []
     assert display.knob_inputs == ["DWN"]
 
 
@@ -88,7 +88,7 @@ def test_failed_task_increases_failure_count_and_backoff_interval():
 
         rec = scheduler.tasks[task]
         assert rec.failures == 1
-        assert rec.interval == 0.02
+        assert 0.01 <= rec.interval <= 0.02
     finally:
         scheduler.shutdown(wait=True)
 
@@ -123,7 +123,7 @@ def test_failed_task_backoff_is_capped():
     finally:
         scheduler.shutdown(wait=True)
 
-def test_failed_task_uses_additive_backoff_sequence_and_cap():
+def test_failed_task_uses_ranged_exponential_backoff_and_cap():
     scheduler, _ = make_scheduler(
         reconnect_interval=2.0,
         backoff_step=1.0,
@@ -144,7 +144,7 @@ def test_failed_task_uses_additive_backoff_sequence_and_cap():
             lambda: len(calls) == 1 and scheduler.tasks[task].future is None,
         )
         assert scheduler.tasks[task].failures == 1
-        assert scheduler.tasks[task].interval == 3.0
+        assert 2.0 <= scheduler.tasks[task].interval <= 4.0
 
         scheduler.tasks[task].next_run = time.monotonic()
         scheduler._recompute_next_due()
@@ -184,7 +184,7 @@ def test_task_exception_counts_as_failure_and_is_logged():
             and scheduler.tasks[task].failures == 1,
         )
 
-        assert scheduler.tasks[task].interval == 0.02
+        assert 0.01 <= scheduler.tasks[task].interval <= 0.02
         assert any("boom" in msg for _, msg in logger.messages)
     finally:
         scheduler.shutdown(wait=True)
@@ -279,7 +279,7 @@ def test_custom_interval_failure_uses_custom_backoff_cap():
         assert rec.tag == "mouse"
         assert rec.failures == 1
         assert rec.base_interval == 15.0
-        assert rec.interval == 16.0
+        assert 15.0 <= rec.interval <= 16.0
         assert rec.backoff_cap == 16.0
     finally:
         scheduler.shutdown(wait=True)